@@ -0,0 +1,112 @@
+"""Streaming reads and writes of article records as JSON Lines or legacy JSON.
+
+The article index, scored articles and priority queue used to be single
+pretty-printed JSON arrays, loaded and dumped whole. Records now flow through
+generators: a ``.jsonl`` path holds one compact JSON object per line and can
+be appended to as new articles arrive, while a ``.json`` path keeps the
+legacy ``indent=2`` array byte for byte, so existing readers are unaffected.
+
+    from article_io import read_records, write_records
+
+    scored = (score(a) for a in read_records("reference/articles-index.jsonl"))
+    write_records("reference/articles-scored.jsonl", scored)
+
+Reading sniffs the content rather than the suffix, so either format is
+accepted from any path. A legacy array still has to be parsed whole; JSON
+Lines input is read one line at a time.
+"""
+
+import filecmp
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from atomic_files import atomic_write, umask_mode
+
+
+def is_jsonl(path):
+    return Path(path).suffix == ".jsonl"
+
+
+def read_records(path):
+    """Yield the records in ``path``, a JSON Lines file or a legacy JSON array."""
+    with open(path, encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        if first == "[":
+            f.seek(0)
+            yield from json.load(f)
+            return
+        f.seek(0)
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_ids(path):
+    """Return the set of record IDs already in ``path`` (empty if it doesn't exist)."""
+    if not os.path.exists(path):
+        return set()
+    return {r["id"] for r in read_records(path)}
+
+
+def _jsonl_lines(records):
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _json_array_chunks(records):
+    # Matches json.dump(list(records), f, indent=2) without building the list:
+    # each item is dumped with indent=2 and shifted one level in.
+    sep = "[\n  "
+    for record in records:
+        yield sep + json.dumps(record, indent=2).replace("\n", "\n  ")
+        sep = ",\n  "
+    yield "\n]" if sep != "[\n  " else "[]"
+
+
+def write_records(path, records, append=False):
+    """Stream ``records`` to ``path`` in the format its suffix selects.
+
+    A new file is written to a temp file and renamed into place, and is left
+    untouched when the new bytes are identical. ``append`` adds lines to the
+    end of an existing JSON Lines file instead. Returns whether ``path``
+    changed.
+    """
+    path = Path(path)
+    if append:
+        if not is_jsonl(path):
+            raise ValueError(f"Only JSON Lines output can be appended to: {path}")
+        changed = False
+        with open(path, "a", encoding="utf-8") as f:
+            for line in _jsonl_lines(records):
+                f.write(line)
+                changed = True
+        return changed
+
+    chunks = _jsonl_lines(records) if is_jsonl(path) else _json_array_chunks(records)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=path.suffix + ".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(chunks)
+        if path.exists() and filecmp.cmp(tmp, path, shallow=False):
+            return False
+        os.chmod(tmp, umask_mode())
+        os.replace(tmp, path)
+        return True
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def write_json(path, data):
+    """Atomically replace ``path`` with ``data`` dumped as ``indent=2`` JSON.
+
+    Readers see either the old document or the new one, never a partial
+    write.
+    """
+    with atomic_write(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
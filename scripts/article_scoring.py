@@ -0,0 +1,929 @@
+"""Article relevance scoring against the 14-capability EM framework.
+
+The rule tables (capabilities, category mapping, keyword weights,
+enrichment and value-signal keywords) and every scoring engine live here,
+free of I/O at import, so workers, tools and notebooks can score articles
+without running score-articles.py:
+
+    from article_scoring import score_article
+
+    score_article({"id": 1, "title": "Running blameless postmortems", "url": "",
+                   "type": "Article", "description": "..."})
+
+The keyword tables are compiled into a phrase index once and kept as a
+pickle in .cache/score-articles/, tagged with a digest of the rule tables,
+so later processes load the matcher instead of rebuilding it.
+"""
+
+import hashlib
+import json
+import pickle
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from atomic_files import atomic_write
+
+try:
+    import numpy as np
+except ImportError:  # only needed for batch and BM25 scoring
+    np = None
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "score-articles"
+CACHE_PATH = CACHE_DIR / "cache.json"
+RULES_PATH = CACHE_DIR / "keyword-tables.pickle"
+BM25_INDEX_PATH = CACHE_DIR / "bm25-index.pickle"
+RULES_FORMAT = ("keyword-tables", 1)
+STREAM_CHUNK = 4096
+# Word counts at which an article's relevance is boosted by half a point
+WORD_COUNT_BOOSTS = (2000, 3000)
+
+# Bump when score_article's logic changes in a way the rule tables don't show
+SCORING_VERSION = 3
+
+# ── Capability Definitions ──────────────────────────────────────────
+CAPABILITIES = {
+    "C1":  {"name": "Org-Level Thinking", "domain": "Strategy"},
+    "C2":  {"name": "Strategic Prioritization", "domain": "Strategy"},
+    "C3":  {"name": "Systems Design & Architecture", "domain": "Execution"},
+    "C4":  {"name": "Operational Leadership & Rhythm", "domain": "Execution"},
+    "C5":  {"name": "Cross-Functional Influence", "domain": "Stakeholder"},
+    "C6":  {"name": "Coaching & Talent Development", "domain": "People"},
+    "C7":  {"name": "Decision Framing & Communication", "domain": "Stakeholder"},
+    "C8":  {"name": "Incidents, Risk & Reliability", "domain": "Reliability"},
+    "C9":  {"name": "Metrics, Measurement & Outcomes", "domain": "Data"},
+    "C10": {"name": "Resource Allocation & Tradeoffs", "domain": "Strategy"},
+    "C11": {"name": "Hiring, Onboarding & Role Design", "domain": "People"},
+    "C12": {"name": "Culture & Norms Shaping", "domain": "People"},
+    "C13": {"name": "Security & Compliance Posture", "domain": "Reliability"},
+    "C14": {"name": "Performance Management & Calibration", "domain": "People"},
+}
+
+# ── Category → Capability Mapping ───────────────────────────────────
+CATEGORY_CAPABILITY_MAP = {
+    "Technical Direction": ["C3", "C8", "C13"],
+    "Career Development":  ["C6", "C14"],
+    "Leadership":          ["C1", "C5", "C10"],
+    "Management":          ["C4", "C6", "C14"],
+    "Hiring & Onboarding": ["C11", "C12"],
+    "Culture":             ["C12", "C7"],
+    "Software Quality":    ["C3", "C8", "C9"],
+    "Velocity & DevEx":    ["C4", "C9"],
+    "Communication":       ["C7", "C5"],
+    "Reporting & Metrics": ["C9"],
+    "AI":                  ["C3", "C9"],
+    "Series":              [],
+    "Handbook":            [],
+    "Course":              [],
+    "Deep Dive":           [],
+    "Uncategorized":       [],
+    "Huddle":              [],
+    "Event_Type":          [],
+    "Test Pattern":        [],
+}
+
+# ── Keyword → Capability Scoring ────────────────────────────────────
+# Each keyword group maps to a capability with a weight. Keywords match whole
+# words (plus regular inflections); a trailing * marks a stem matching any
+# word it begins.
+KEYWORD_SCORES = {
+    "C1": {
+        3: ["organizational strategy", "org design", "org structure", "company strategy",
+            "organizational change", "org-level", "strategic vision", "business strategy",
+            "transformation*", "reorg*", "restructur*"],
+        2: ["strategy", "vision", "alignment", "misalignment", "executive", "c-suite", "board",
+            "company-wide", "enterprise", "organizational", "north star",
+            "strategic planning", "business objectives", "mission"],
+        1: ["leadership", "senior leader*", "director", "vp", "vice president",
+            "long-term", "big picture"],
+    },
+    "C2": {
+        3: ["strategic prioritization", "prioritization framework", "roadmap prioritization",
+            "okr", "okrs", "strategy execution", "quarterly planning", "annual planning",
+            "product strategy"],
+        2: ["prioritiz*", "roadmap", "backlog", "sprint planning", "resource priorit*",
+            "trade-off", "tradeoff", "opportunity cost", "scope", "focus"],
+        1: ["planning", "goals", "objectives", "initiative", "project selection"],
+    },
+    "C3": {
+        3: ["system design", "systems design", "architecture decision", "technical architecture",
+            "microservice", "monolith*", "distributed system", "platform engineering",
+            "technical strategy", "tech debt strategy"],
+        2: ["architecture", "technical decision", "design review", "code review",
+            "tech debt", "technical debt", "scalability", "system reliability",
+            "infrastructure", "api design", "migration"],
+        1: ["technical", "sociotechnical", "engineering", "overengineering", "design", "redesign",
+            "platform", "framework", "moderniz*", "legacy"],
+    },
+    "C4": {
+        3: ["operational cadence", "team rhythm", "sprint retro*", "agile transformation",
+            "delivery management", "engineering operations", "process improvement",
+            "operational excellence"],
+        2: ["agile", "scrum", "kanban", "sprint", "standup", "retrospective",
+            "delivery", "process", "workflow", "operational*", "cadence",
+            "ceremonies", "rituals"],
+        1: ["team process", "meeting", "efficiency", "inefficiency", "productivity", "execution"],
+    },
+    "C5": {
+        3: ["cross-functional*", "stakeholder management", "stakeholder alignment",
+            "influence without authority", "cross-team collaboration",
+            "product partnership", "executive communication"],
+        2: ["stakeholder", "influence", "partnership", "collaboration",
+            "cross-team", "alignment", "misalignment", "negotiate", "negotiation",
+            "product manager", "product management"],
+        1: ["relationship", "partner*", "communicate", "persuade", "advocate"],
+    },
+    "C6": {
+        3: ["coaching engineer", "1:1", "one-on-one", "career development",
+            "career growth", "mentoring engineer", "talent development",
+            "career ladder", "career framework", "career path",
+            "skill development", "growth plan"],
+        2: ["coaching", "mentoring", "mentor*", "feedback", "career",
+            "development plan", "skill gap", "learning path", "grow",
+            "growth", "sponsor*"],
+        1: ["training", "learning", "develop*", "talent", "potential"],
+    },
+    "C7": {
+        3: ["decision framework", "decision making", "decision-making",
+            "communication strategy", "difficult conversation",
+            "transparent communication", "decision framing", "rfc process",
+            "adr", "architecture decision record"],
+        2: ["decision", "communicate", "communication", "miscommunication", "transparency",
+            "difficult conversation", "conflict resolution", "messaging",
+            "narrative", "storytelling", "framing", "reframing", "context setting"],
+        1: ["inform", "share", "explain", "clarity", "clear", "clearly", "message"],
+    },
+    "C8": {
+        3: ["incident management", "incident response", "on-call", "oncall",
+            "postmortem", "post-mortem", "blameless", "reliability engineering",
+            "sre", "site reliability", "disaster recovery", "chaos engineering"],
+        2: ["incident", "outage", "reliability", "resilience", "risk management",
+            "risk assessment", "downtime", "availability", "failover",
+            "monitoring", "alerting", "observability"],
+        1: ["risk", "failure", "recovery", "uptime", "sla", "slo", "sli"],
+    },
+    "C9": {
+        3: ["engineering metrics", "dora metrics", "developer productivity metrics",
+            "space framework", "measurement framework", "kpi engineering",
+            "engineering effectiveness", "developer experience metric"],
+        2: ["metric", "metrics", "measurement", "measure", "kpi", "okr",
+            "dora", "lead time", "deployment frequency", "cycle time",
+            "throughput", "velocity metric", "developer experience",
+            "devex survey", "developer satisfaction"],
+        1: ["data", "dashboard", "report", "analytics", "track", "benchmark"],
+    },
+    "C10": {
+        3: ["resource allocation", "team allocation", "capacity planning",
+            "headcount planning", "budget allocation", "staffing model",
+            "team sizing", "resourcing"],
+        2: ["resource", "allocation", "capacity", "headcount", "budget",
+            "staffing", "team size", "right-sizing", "outsourc*",
+            "contractor", "vendor", "tradeoff", "trade-off"],
+        1: ["cost", "costly", "invest*", "roi", "efficiency", "inefficiency", "optimize",
+            "constraint"],
+    },
+    "C11": {
+        3: ["hiring engineer", "technical interview", "interview process",
+            "onboarding engineer", "onboarding program", "recruiting engineer",
+            "job description", "role design", "hiring pipeline",
+            "interview loop", "hiring bar"],
+        2: ["hiring", "interview", "onboarding", "recruiting", "recruitment",
+            "candidate", "offer", "job post", "talent acquisition",
+            "new hire", "ramp up", "ramp-up", "first 90 days"],
+        1: ["hire", "team building", "team composition", "role"],
+    },
+    "C12": {
+        3: ["engineering culture", "team culture", "culture change",
+            "psychological safety", "inclusive culture", "team norms",
+            "culture shaping", "belonging"],
+        2: ["culture", "diversity", "neurodiversity", "inclusion", "dei", "equity",
+            "psychological safety", "trust", "norms", "values",
+            "inclusive", "belonging", "team dynamic", "team health",
+            "toxicity", "toxic"],
+        1: ["environment", "morale", "engagement", "community", "safe space"],
+    },
+    "C13": {
+        3: ["security engineering", "compliance framework", "security posture",
+            "security culture", "devsecops", "security review",
+            "regulatory compliance", "gdpr", "sox", "pci",
+            "threat model", "vulnerability management"],
+        2: ["security", "cybersecurity", "compliance", "regulation", "audit", "privacy",
+            "data protection", "access control", "authentication",
+            "authorization", "encryption"],
+        1: ["secure", "securely", "protect", "govern*", "policy", "standard", "standardiz*"],
+    },
+    "C14": {
+        3: ["performance review", "performance management", "calibration session",
+            "performance improvement plan", "pip", "promotion process",
+            "compensation", "perf review", "performance calibration",
+            "underperformer", "high performer"],
+        2: ["performance", "review cycle", "evaluation", "promotion",
+            "raise", "comp", "compensation", "bonus", "calibrat*",
+            "underperform*", "low performer", "rating"],
+        1: ["assess*", "evaluate", "apprais*", "reward", "recognition"],
+    },
+}
+
+# ── Enrichment Type Detection ───────────────────────────────────────
+ENRICHMENT_KEYWORDS = {
+    "playbook": ["how to", "step by step", "guide to", "playbook", "framework for",
+                 "approach to", "strategy for", "template", "checklist",
+                 "practical guide*", "handbook", "tactics", "best practice",
+                 "ways to", "tips for", "techniques"],
+    "anti-pattern": ["mistake", "anti-pattern", "antipattern", "avoid*", "don't",
+                     "wrong way", "pitfall", "trap", "fail", "failure",
+                     "bad practice", "what not to", "common error", "dysfunction",
+                     "toxic", "red flag", "warning sign"],
+    "observable": ["sign", "signal", "indicator", "behavior*", "observable",
+                   "how to spot", "how to tell", "recognize", "identify",
+                   "characteristic", "trait", "pattern"],
+    "interview-question": ["interview", "question", "hiring", "assess candidate",
+                          "evaluate candidate", "behavioral question"],
+    "calibration-signal": ["calibration", "performance review", "promo packet",
+                          "level", "leveling", "levelling", "senior vs", "staff vs",
+                          "what good looks like", "bar for"],
+    "learning-resource": ["learn*", "course", "book", "resource", "reading",
+                         "education", "training", "workshop", "talk",
+                         "conference", "tutorial", "deep dive"],
+    "measurement-guidance": ["measure*", "metric", "kpi", "benchmark",
+                            "dashboard", "data-driven", "quantif*",
+                            "leading indicator", "lagging indicator"],
+    "rubric-anchor": ["level", "leveling", "levelling", "senior", "seniority", "staff",
+                     "principal", "career ladder", "expectations", "competency",
+                     "progression", "growth framework"],
+}
+
+# ── Value Signal Detection ──────────────────────────────────────────
+VALUE_SIGNALS = {
+    "framework": ["framework", "model", "matrix", "taxonomy", "spectrum",
+                  "quadrant", "continuum", "archetype"],
+    "case-study": ["case study", "at scale", "how we", "lessons from",
+                   "story of", "experience at", "our journey",
+                   "real-world", "in practice"],
+    "anti-pattern": ["mistake", "anti-pattern", "failure", "what went wrong",
+                     "what not to", "pitfall", "trap"],
+    "technique": ["technique", "tactic*", "approach", "method*", "practice",
+                  "hack", "tip", "trick", "strategy"],
+    "metric": ["metric", "measurement", "benchmark", "data", "survey",
+               "quantitative*", "research finding"],
+    "research": ["research", "study", "survey", "data shows", "evidence",
+                 "finding", "analysis", "report"],
+}
+
+
+# ── Multi-keyword Matching ──────────────────────────────────────────
+# Words are runs of letters and digits, except that a digit:digit ratio such
+# as "1:1" (or "1:1s") stays one token rather than matching "1.1" or "1-1"
+TOKEN_RE = re.compile(r"[0-9]+:[0-9]+[a-z]*|[a-z0-9]+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def word_forms(word):
+    """Return ``word`` with its regular inflections: plural, -ed, -ing and -er forms."""
+    forms = {word, word + "s", word + "es", word + "ed", word + "ing", word + "er", word + "ers"}
+    if word.endswith("e"):
+        forms |= {word + "d", word + "r", word + "rs", word[:-1] + "ing"}
+    if word.endswith("y"):
+        forms |= {word[:-1] + "ies", word[:-1] + "ied"}
+    return forms
+
+
+class PhraseIndex:
+    """Token-level keyword index: a text is tokenised once and every keyword is a lookup.
+
+    Keywords are split into the same TOKEN_RE tokens as the text, so they
+    only ever match whole words ("sre" no longer hits "measure"). A keyword's
+    last word also matches its regular inflections ("metric" finds "metrics");
+    those forms are expanded up front, so a single word is one hash lookup
+    per token and a phrase is an n-gram lookup at the tokens that begin one.
+    A keyword ending in ``*`` is a stem whose last word matches any word it
+    begins ("prioritiz*" finds "prioritization"); stems are keyed by their
+    text, so a token costs one slice-and-lookup per distinct stem length.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        grams, stems = {}, {}
+        for kw_id, kw in enumerate(self.keywords):
+            tokens = tokenize(kw)
+            if kw.endswith("*"):
+                stems.setdefault(tokens[-1], {}).setdefault(tuple(tokens[:-1]), set()).add(kw_id)
+            else:
+                for form in word_forms(tokens[-1]):
+                    grams.setdefault((*tokens[:-1], form), set()).add(kw_id)
+        # Single words are looked up directly; phrases only at tokens that start one
+        self._words = {g[0]: tuple(ids) for g, ids in grams.items() if len(g) == 1}
+        self._phrases = {g: tuple(ids) for g, ids in grams.items() if len(g) > 1}
+        self._phrase_sizes = {}
+        for g in self._phrases:
+            self._phrase_sizes.setdefault(g[0], set()).add(len(g))
+        self._phrase_sizes = {w: sorted(sizes) for w, sizes in self._phrase_sizes.items()}
+        # stem → {leading tokens → keyword ids}
+        self._stems = {stem: {lead: tuple(ids) for lead, ids in leads.items()}
+                       for stem, leads in stems.items()}
+        self._stem_lengths = sorted({len(stem) for stem in stems})
+
+    def _matches(self, tokens):
+        """Return the keyword-id tuples matched at each position of ``tokens``."""
+        words, phrases, phrase_sizes = self._words, self._phrases, self._phrase_sizes
+        stems, stem_lengths = self._stems, self._stem_lengths
+        shortest_stem = stem_lengths[0] if stem_lengths else 0
+        matches = []
+        for i, token in enumerate(tokens):
+            ids = words.get(token)
+            if ids:
+                matches.append(ids)
+            for n in phrase_sizes.get(token, ()):
+                ids = phrases.get(tuple(tokens[i:i + n]))
+                if ids:
+                    matches.append(ids)
+            if len(token) >= shortest_stem and stem_lengths:
+                for length in stem_lengths:
+                    leads = stems.get(token[:length])
+                    if leads:
+                        for lead, ids in leads.items():
+                            if not lead or tuple(tokens[max(i - len(lead), 0):i]) == lead:
+                                matches.append(ids)
+        return matches
+
+    def find(self, text):
+        """Return the ids of every keyword occurring in ``text``."""
+        hits = set()
+        for ids in self._matches(tokenize(text)):
+            hits.update(ids)
+        return hits
+
+    def count(self, tokens):
+        """Return how many times each keyword id occurs in a tokenised text."""
+        counts = Counter()
+        for ids in self._matches(tokens):
+            counts.update(ids)
+        return counts
+
+
+def compile_keyword_tables():
+    """Compile every keyword table into one phrase index plus per-keyword postings.
+
+    Each keyword's postings record the capability weight groups, enrichment
+    types and value signals it belongs to; a keyword listed twice under the
+    same value signal counts twice, as it does in the tables.
+    """
+    postings = {}
+
+    def posting(kw):
+        return postings.setdefault(kw, (set(), set(), []))
+
+    for cap_id, weight_groups in KEYWORD_SCORES.items():
+        for weight, keywords in weight_groups.items():
+            for kw in keywords:
+                posting(kw)[0].add((cap_id, weight))
+    for etype, keywords in ENRICHMENT_KEYWORDS.items():
+        for kw in keywords:
+            posting(kw)[1].add(etype)
+    for signal, keywords in VALUE_SIGNALS.items():
+        for kw in keywords:
+            posting(kw)[2].append(signal)
+
+    index = PhraseIndex(postings)
+    return index, [postings[kw] for kw in index.keywords]
+
+
+_KEYWORD_TABLES = None
+
+
+def keyword_tables():
+    """Return the compiled (PhraseIndex, postings), loading them on first use."""
+    global _KEYWORD_TABLES
+    if _KEYWORD_TABLES is None:
+        _KEYWORD_TABLES = load_keyword_tables()
+    return _KEYWORD_TABLES
+
+
+def load_keyword_tables(path=RULES_PATH):
+    """Load the compiled keyword tables from the rule cache, compiling them on a miss.
+
+    The cache is tagged with rules_digest(), so editing any rule table
+    recompiles it. A cache that can't be written (say, a read-only
+    checkout) just means compiling in every process.
+    """
+    header = (RULES_FORMAT, rules_digest())
+    try:
+        with open(path, 'rb') as f:
+            if pickle.load(f) == header:
+                return pickle.load(f)
+    except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+        pass
+    tables = compile_keyword_tables()
+    try:
+        with atomic_write(path) as f:
+            pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(tables, f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return tables
+
+
+def score_article(article):
+    """Score a single article for relevance to the EM framework."""
+    title = (article.get('title') or '').lower()
+    desc = (article.get('description') or '').lower()
+    category = article.get('category', '')
+    text = f"{title} {desc}"
+
+    # One tokenisation of the text finds every keyword from every table
+    keyword_index, postings = keyword_tables()
+    groups_hit, etypes_hit, signal_hits = set(), set(), defaultdict(int)
+    for kw_id in keyword_index.find(text):
+        groups, etypes, signals = postings[kw_id]
+        groups_hit |= groups
+        etypes_hit |= etypes
+        for signal in signals:
+            signal_hits[signal] += 1
+
+    # ── Capability Scoring ──────────────────────────────
+    capability_scores = defaultdict(float)
+
+    # 1. Category mapping gives base score
+    if category in CATEGORY_CAPABILITY_MAP:
+        for cap in CATEGORY_CAPABILITY_MAP[category]:
+            capability_scores[cap] += 1.5
+
+    # 2. Keyword matching: each weight group counts once if any keyword hit
+    for cap_id, weight_groups in KEYWORD_SCORES.items():
+        for weight in weight_groups:
+            if (cap_id, weight) in groups_hit:
+                capability_scores[cap_id] += weight
+
+    # Rank capabilities; the top two become primary and secondary
+    sorted_caps = sorted(capability_scores.items(), key=lambda x: -x[1])
+    sorted_caps = [(c, s) for c, s in sorted_caps if s >= 1.0]
+
+    # ── Overall Relevance Score (1-5) ───────────────────
+    max_cap_score = sorted_caps[0][1] if sorted_caps else 0
+
+    if max_cap_score >= 6:
+        relevance = 5
+    elif max_cap_score >= 4:
+        relevance = 4
+    elif max_cap_score >= 2.5:
+        relevance = 3
+    elif max_cap_score >= 1.0:
+        relevance = 2
+    else:
+        relevance = 1
+
+    # Boost for substantive content
+    word_count = article.get('wordCount', 0)
+    for threshold in WORD_COUNT_BOOSTS:
+        if word_count >= threshold and relevance < 5:
+            relevance = min(relevance + 0.5, 5)
+
+    # Round to nearest int
+    relevance = round(relevance)
+
+    # ── Enrichment Types ────────────────────────────────
+    enrichment_types = [etype for etype in ENRICHMENT_KEYWORDS if etype in etypes_hit]
+
+    # ── Value Signal ────────────────────────────────────
+    value_signal = "general"
+    best_signal_score = 0
+    for signal in VALUE_SIGNALS:
+        score = signal_hits[signal]
+        if score > best_signal_score:
+            best_signal_score = score
+            value_signal = signal
+
+    primary, secondary, cap_scores = _capability_fields(sorted_caps[:5])
+    return _scored_record(article, relevance, primary, secondary, enrichment_types,
+                          value_signal, cap_scores)
+
+
+def _capability_fields(ranked):
+    """Return primary, secondary and capabilityScores from (capability, score) pairs, best first."""
+    return (ranked[0][0] if ranked else "general",
+            ranked[1][0] if len(ranked) > 1 else None,
+            {cap: round(score, 1) for cap, score in ranked})
+
+
+def _scored_record(article, relevance, primary, secondary, enrichment_types, value_signal,
+                   capability_scores):
+    """Build the scored record every scoring mode returns for ``article``.
+
+    The score arguments come in SCORE_FIELDS order, so a cached field list
+    can be passed straight through. No enrichment type means
+    "learning-resource".
+    """
+    return {
+        "id": article['id'],
+        "title": article['title'],
+        "url": article['url'],
+        "category": article.get('category', ''),
+        "type": article['type'],
+        "date": article.get('date', ''),
+        "wordCount": article.get('wordCount', 0),
+        "description": article.get('description', ''),
+        "relevance": relevance,
+        "primaryCapability": primary,
+        "secondaryCapability": secondary,
+        "enrichmentTypes": enrichment_types or ["learning-resource"],
+        "valueSignal": value_signal,
+        "capabilityScores": capability_scores,
+    }
+
+
+def _word_count_boost(relevance, articles):
+    """Apply score_article's word-count boost to an array of relevances and round them.
+
+    Half-to-even rounding, like round().
+    """
+    word_counts = np.array([a.get('wordCount', 0) for a in articles], dtype=float)
+    relevance = relevance.astype(float)
+    for threshold in WORD_COUNT_BOOSTS:
+        boost = (word_counts >= threshold) & (relevance < 5)
+        relevance[boost] = np.minimum(relevance[boost] + 0.5, 5)
+    return np.round(relevance).astype(int)
+
+
+# ── Batch Scoring ───────────────────────────────────────────────────
+def _expand(rows, cols, indptr, indices):
+    """Follow CSR lists: for each (row, col) pair, pair row with every indices entry of col."""
+    starts = indptr[cols]
+    lengths = indptr[cols + 1] - starts
+    total = int(lengths.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(rows, lengths), indices[np.repeat(starts, lengths) + offsets]
+
+
+def _csr(lists):
+    """Pack a list of int lists into (indptr, indices) arrays."""
+    indptr = np.zeros(len(lists) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(x) for x in lists])
+    indices = np.fromiter((i for x in lists for i in x), dtype=np.int64, count=int(indptr[-1]))
+    return indptr, indices
+
+
+def build_hit_matrix(articles):
+    """Return the sparse article×keyword hit matrix as CSR (indptr, keyword ids)."""
+    keyword_index, _ = keyword_tables()
+    hits = []
+    for article in articles:
+        title = (article.get('title') or '').lower()
+        desc = (article.get('description') or '').lower()
+        hits.append(sorted(keyword_index.find(f"{title} {desc}")))
+    return _csr(hits)
+
+
+def score_batch(articles):
+    """Score many articles at once; returns exactly what score_article would.
+
+    The keyword pass runs once per article to build a sparse hit matrix.
+    Capability scores, relevance tiers, enrichment types and value signals
+    are then computed for every article together with NumPy array
+    operations, so rescoring is dominated by that single keyword pass.
+    """
+    if np is None:
+        raise SystemExit("ERROR: --batch needs NumPy (pip install numpy)")
+    articles = list(articles)
+    _, postings = keyword_tables()
+    n = len(articles)
+    caps = list(KEYWORD_SCORES)
+    cap_index = {cap: i for i, cap in enumerate(caps)}
+    groups = [(cap, weight) for cap, weight_groups in KEYWORD_SCORES.items()
+              for weight in weight_groups]
+    group_index = {g: i for i, g in enumerate(groups)}
+    etypes = list(ENRICHMENT_KEYWORDS)
+    signals = list(VALUE_SIGNALS)
+
+    # keyword → groups / types / signals, as CSR so hits can be expanded in bulk
+    kw_groups = _csr([sorted(group_index[g] for g in p[0]) for p in postings])
+    kw_etypes = _csr([sorted(etypes.index(e) for e in p[1]) for p in postings])
+    kw_signals = _csr([[signals.index(v) for v in p[2]] for p in postings])
+
+    indptr, kw_ids = build_hit_matrix(articles)
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+
+    # Capability scores: category base plus the weight of every group hit
+    group_hit = np.zeros((n, len(groups)), dtype=bool)
+    group_hit[_expand(rows, kw_ids, *kw_groups)] = True
+    group_weights = np.zeros((len(groups), len(caps)))
+    for g, (cap, weight) in enumerate(groups):
+        group_weights[g, cap_index[cap]] = weight
+
+    categories = {category: c for c, category in enumerate(CATEGORY_CAPABILITY_MAP)}
+    category_base = np.zeros((len(categories) + 1, len(caps)))
+    # Ties in score keep dict insertion order: category capabilities first,
+    # then keyword-matched ones in KEYWORD_SCORES order.
+    insertion_rank = np.tile(np.arange(len(caps)) + len(caps), (len(categories) + 1, 1))
+    for category, c in categories.items():
+        for pos, cap in enumerate(CATEGORY_CAPABILITY_MAP[category]):
+            category_base[c, cap_index[cap]] += 1.5
+            insertion_rank[c, cap_index[cap]] = min(insertion_rank[c, cap_index[cap]], pos)
+    category_ids = np.array([categories.get(a.get('category', ''), len(categories))
+                             for a in articles], dtype=np.int64)
+    scores = category_base[category_ids] + group_hit @ group_weights
+    scores[scores < 1.0] = 0.0
+
+    order = np.lexsort((insertion_rank[category_ids], -scores), axis=-1)[:, :5]
+    top_scores = np.take_along_axis(scores, order, axis=1)
+
+    # Relevance: thresholds on the best score, then word-count boosts
+    best = top_scores[:, 0]
+    relevance = np.select([best >= 6, best >= 4, best >= 2.5, best >= 1.0], [5, 4, 3, 2], 1)
+    relevance = _word_count_boost(relevance, articles)
+
+    etype_hit = np.zeros((n, len(etypes)), dtype=bool)
+    etype_hit[_expand(rows, kw_ids, *kw_etypes)] = True
+
+    signal_rows, signal_ids = _expand(rows, kw_ids, *kw_signals)
+    signal_counts = np.bincount(signal_rows * len(signals) + signal_ids,
+                                minlength=n * len(signals)).reshape(n, len(signals))
+    best_signal = np.argmax(signal_counts, axis=1)
+    has_signal = signal_counts.max(axis=1) > 0
+
+    scored = []
+    for i, article in enumerate(articles):
+        ranked = [(caps[c], float(v)) for c, v in zip(order[i], top_scores[i]) if v >= 1.0]
+        enrichment_types = [etypes[t] for t in np.flatnonzero(etype_hit[i])]
+        value_signal = signals[best_signal[i]] if has_signal[i] else "general"
+        primary, secondary, cap_scores = _capability_fields(ranked)
+        scored.append(_scored_record(article, int(relevance[i]), primary, secondary,
+                                     enrichment_types, value_signal, cap_scores))
+    return scored
+
+
+# ── Parallel Scoring ────────────────────────────────────────────────
+def score_chunk(chunk, batch=False):
+    """Score one chunk of articles in a worker."""
+    return score_batch(chunk) if batch else [score_article(a) for a in chunk]
+
+
+def score_parallel(articles, workers, batch=False, chunk_size=None, pool=None):
+    """Score articles across a process pool and merge results in input order.
+
+    Each worker loads the compiled keyword tables once, from the rule cache,
+    rather than once per chunk. Chunks are merged back in order,
+    making the output identical to a serial run. Pass ``pool`` to reuse an
+    executor across calls instead of starting one per call.
+    """
+    chunk_size = chunk_size or max(1, -(-len(articles) // (workers * 4)))
+    if pool is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return score_parallel(articles, workers, batch, chunk_size, pool)
+    chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+    results = pool.map(score_chunk, chunks, [batch] * len(chunks))
+    return [a for chunk in results for a in chunk]
+
+
+# ── Scoring Cache ───────────────────────────────────────────────────
+# Article fields that feed scoring, and the fields scoring produces
+CONTENT_FIELDS = ('title', 'description', 'category', 'type', 'wordCount')
+SCORE_FIELDS = ('relevance', 'primaryCapability', 'secondaryCapability',
+                'enrichmentTypes', 'valueSignal', 'capabilityScores')
+
+
+def _digest(value):
+    text = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def rules_digest():
+    """Digest of every rule table scoring reads; any edit invalidates the cache."""
+    return _digest([SCORING_VERSION, CAPABILITIES, CATEGORY_CAPABILITY_MAP,
+                    KEYWORD_SCORES, ENRICHMENT_KEYWORDS, VALUE_SIGNALS])
+
+
+def content_digest(article):
+    return _digest([article.get(k) for k in CONTENT_FIELDS])
+
+
+class ScoreCache:
+    """Persistent scores keyed by article id, valid for one digest of the rule tables.
+
+    Each entry is ``[content digest, score fields]``. Entries for articles
+    that aren't seen again are dropped on ``save`` unless ``keep_unseen``.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.cached = self._load()
+        self.entries = {}
+        self.rescored = 0
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if cache.get('rules') != rules_digest():
+            return {}
+        return cache.get('articles', {})
+
+    def save(self, keep_unseen=False):
+        entries = {**self.cached, **self.entries} if keep_unseen else self.entries
+        with atomic_write(self.path, 'w') as f:
+            json.dump({'rules': rules_digest(), 'articles': entries}, f, separators=(',', ':'))
+
+    def score(self, articles, score):
+        """Score only the articles that are new or changed since they were cached.
+
+        ``score`` maps a list of articles to scored records. Returns the
+        scored records in input order.
+        """
+        digests = [content_digest(a) for a in articles]
+        stale = [i for i, (a, d) in enumerate(zip(articles, digests))
+                 if self.cached.get(str(a['id']), (None,))[0] != d]
+        fresh = dict(zip(stale, score([articles[i] for i in stale])))
+        self.rescored += len(stale)
+
+        scored = []
+        for i, (article, digest) in enumerate(zip(articles, digests)):
+            if i in fresh:
+                result = fresh[i]
+                fields = [result[k] for k in SCORE_FIELDS]
+            else:
+                fields = self.cached[str(article['id'])][1]
+                result = _scored_record(article, *fields)
+            scored.append(result)
+            self.entries[str(article['id'])] = [digest, fields]
+        return scored
+
+
+def score_stream(articles, score, cache=None, chunk_size=STREAM_CHUNK):
+    """Yield scored records for an iterable of articles, one chunk at a time.
+
+    Only ``chunk_size`` articles are held at once, so memory stays flat as
+    the corpus grows. With a ``cache``, each chunk is scored through it.
+    """
+    articles = iter(articles)
+    while chunk := list(islice(articles, chunk_size)):
+        yield from cache.score(chunk, score) if cache else score(chunk)
+
+
+# ── BM25 Scoring ────────────────────────────────────────────────────
+BM25_K1 = 1.2
+BM25_B = 0.75
+BM25_FORMAT = ("bm25-index", 1)
+
+# In BM25 scoring, relevance 3, 4 and 5 start at these quantiles of the best
+# capability score among articles with any match, giving tiers of roughly
+# the classic mode's sizes before the word-count boost.
+BM25_RELEVANCE_QUANTILES = (0.45, 0.80, 0.94)
+
+
+def corpus_digest(articles):
+    """Digest of the rule tables plus every article's id and scored content, in order."""
+    digest = hashlib.sha256(rules_digest().encode('utf-8'))
+    for a in articles:
+        digest.update(f"{a['id']}:{content_digest(a)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class Bm25Index:
+    """Inverted index of keyword occurrences over one article corpus, for BM25.
+
+    Terms are the keywords of every rule table, as found by the phrase index,
+    plus one term per category. A capability's query is then its keywords
+    weighted as in KEYWORD_SCORES and its categories weighted 1.5, as in the
+    classic mode. Each term's postings hold the articles it occurs in and its
+    precomputed BM25 impact (idf times saturated, length-normalised term
+    frequency) in each, so ranking every article against a query is a walk
+    over that query's postings.
+    """
+
+    def __init__(self, articles, digest=None):
+        keyword_index, _ = keyword_tables()
+        n_keywords = len(keyword_index.keywords)
+        categories = {category: c for c, category in enumerate(CATEGORY_CAPABILITY_MAP)}
+        self.digest = digest or corpus_digest(articles)
+        self.n_terms = n_keywords + len(categories)
+
+        term_docs = defaultdict(list)
+        term_freqs = defaultdict(list)
+        keyword_lists, lengths = [], []
+        for doc, article in enumerate(articles):
+            title = (article.get('title') or '').lower()
+            desc = (article.get('description') or '').lower()
+            tokens = tokenize(f"{title} {desc}")
+            counts = keyword_index.count(tokens)
+            category = categories.get(article.get('category', ''))
+            if category is not None:
+                counts[n_keywords + category] += 1
+            for term, tf in counts.items():
+                term_docs[term].append(doc)
+                term_freqs[term].append(tf)
+            keyword_lists.append(sorted(t for t in counts if t < n_keywords))
+            lengths.append(len(tokens) + 1)
+
+        self.n_docs = len(lengths)
+        lengths = np.array(lengths, dtype=float)
+        self.avgdl = float(lengths.mean()) if self.n_docs else 0.0
+        # Forward keyword lists (CSR) for enrichment types and value signals
+        self.keyword_indptr, self.keyword_ids = _csr(keyword_lists)
+
+        self.df = np.zeros(self.n_terms, dtype=np.int64)
+        self.idf = np.zeros(self.n_terms)
+        self.postings = {}
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / (self.avgdl or 1))
+        for term, docs in term_docs.items():
+            docs = np.array(docs, dtype=np.int64)
+            tf = np.array(term_freqs[term], dtype=float)
+            self.df[term] = len(docs)
+            self.idf[term] = np.log(1 + (self.n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            self.postings[term] = (docs, self.idf[term] * tf * (BM25_K1 + 1) / (tf + norm[docs]))
+
+    @classmethod
+    def load_or_build(cls, articles, path=BM25_INDEX_PATH):
+        """Return the persisted index if it was built from exactly these articles, else build and persist one."""
+        digest = corpus_digest(articles)
+        try:
+            with open(path, 'rb') as f:
+                if pickle.load(f) == BM25_FORMAT:
+                    state = pickle.load(f)
+                    if state.get('digest') == digest:
+                        index = cls.__new__(cls)
+                        index.__dict__.update(state)
+                        return index
+        except (OSError, EOFError, AttributeError, ValueError, pickle.UnpicklingError):
+            pass
+        index = cls(articles, digest)
+        index.save(path)
+        return index
+
+    def save(self, path=BM25_INDEX_PATH):
+        with atomic_write(path) as f:
+            pickle.dump(BM25_FORMAT, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.__dict__, f, pickle.HIGHEST_PROTOCOL)
+
+    def rank(self, query):
+        """Return every article's BM25 score for ``query`` (term id → weight)."""
+        scores = np.zeros(self.n_docs)
+        for term, weight in query.items():
+            posting = self.postings.get(term)
+            if posting is not None:
+                docs, impact = posting
+                scores[docs] += weight * impact
+        return scores
+
+
+def capability_queries():
+    """Return each capability's BM25 query: term id → weight."""
+    keyword_index, postings = keyword_tables()
+    n_keywords = len(keyword_index.keywords)
+    queries = {cap: {} for cap in KEYWORD_SCORES}
+    for kw_id, (groups, _, _) in enumerate(postings):
+        for cap, weight in groups:
+            queries[cap][kw_id] = max(weight, queries[cap].get(kw_id, 0))
+    for c, category in enumerate(CATEGORY_CAPABILITY_MAP):
+        for cap in CATEGORY_CAPABILITY_MAP[category]:
+            queries[cap][n_keywords + c] = 1.5
+    return queries
+
+
+def score_bm25(articles, index=None):
+    """Score a whole corpus with BM25 capability queries instead of keyword-weight sums.
+
+    Returns records with the same fields as score_article. Capability scores
+    are BM25 scores; relevance comes from where the best of them falls in
+    the corpus (BM25_RELEVANCE_QUANTILES), plus the usual word-count boost.
+    Enrichment types and value signals are found exactly as in the classic
+    mode.
+    """
+    if np is None:
+        raise SystemExit("ERROR: --mode bm25 needs NumPy (pip install numpy)")
+    articles = list(articles)
+    index = index or Bm25Index(articles)
+    _, postings = keyword_tables()
+    caps = list(KEYWORD_SCORES)
+    scores = np.stack([index.rank(q) for q in capability_queries().values()], axis=1)
+
+    best = scores.max(axis=1) if len(caps) else np.zeros(index.n_docs)
+    matched = best[best > 0]
+    cuts = np.quantile(matched, BM25_RELEVANCE_QUANTILES) if len(matched) else (np.inf,) * 3
+    relevance = np.where(best > 0, 2 + np.searchsorted(cuts, best, side='right'), 1)
+    relevance = _word_count_boost(relevance, articles)
+    order = np.argsort(-scores, axis=1, kind='stable')[:, :5]
+
+    scored = []
+    for i, article in enumerate(articles):
+        ranked = [(caps[c], float(scores[i, c])) for c in order[i] if scores[i, c] > 0]
+        etypes_hit, signal_hits = set(), defaultdict(int)
+        for kw_id in index.keyword_ids[index.keyword_indptr[i]:index.keyword_indptr[i + 1]]:
+            _, etypes, signals = postings[kw_id]
+            etypes_hit |= etypes
+            for signal in signals:
+                signal_hits[signal] += 1
+        enrichment_types = [e for e in ENRICHMENT_KEYWORDS if e in etypes_hit]
+        value_signal, best_signal_score = "general", 0
+        for signal in VALUE_SIGNALS:
+            if signal_hits[signal] > best_signal_score:
+                best_signal_score, value_signal = signal_hits[signal], signal
+        primary, secondary, cap_scores = _capability_fields(ranked)
+        scored.append(_scored_record(article, int(relevance[i]), primary, secondary,
+                                     enrichment_types, value_signal, cap_scores))
+    return scored
@@ -0,0 +1,47 @@
+"""Helpers for files written to a temp file and renamed into place.
+
+Outputs are built with ``tempfile.mkstemp`` next to their destination and
+``os.replace``d over it, so readers never see a partial file, and
+concurrent writers each get their own temp file rather than racing on one
+fixed name. mkstemp creates its file 0600, though, and the rename would
+carry that mode over to an output that a plain ``open()`` would have made
+group/world-readable, so the temp file gets umask_mode() first.
+atomic_write does all of that:
+
+    from atomic_files import atomic_write
+
+    with atomic_write(path) as f:
+        pickle.dump(state, f)
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def umask_mode():
+    """Return the mode a plain open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@contextmanager
+def atomic_write(path, mode="wb", **kwargs):
+    """Open a fresh temp file next to ``path``; when the block ends it replaces ``path``.
+
+    ``mode`` and ``kwargs`` are passed to open(). If the block raises, the
+    temp file is removed and ``path`` is left as it was.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=path.suffix + ".tmp")
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.chmod(tmp, umask_mode())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
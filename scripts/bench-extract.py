@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark extract-data.py against synthetic matrix workbooks.
+
+For each scale, a synthetic workbook is generated (and cached) with
+generate-synthetic-matrix.py, then extracted twice into a scratch directory:
+
+  cold  no manifest and no sheet snapshots, so every sheet goes through openpyxl
+  warm  --force with snapshots in place, so every transform re-runs on cached rows
+
+Each run records wall time, rows per second and the extractor's peak RSS.
+Results are compared against the stored baseline and the script exits
+non-zero when throughput drops, or memory grows, by more than the tolerance.
+
+Usage:
+    python3 scripts/bench-extract.py                    # scales 1 and 10
+    python3 scripts/bench-extract.py --scales 1,10,100 --jobs 4
+    python3 scripts/bench-extract.py --update-baseline
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from bench_common import (
+    BASELINE_DIR,
+    add_baseline_arguments,
+    load_baseline,
+    report,
+    run_script,
+    synthetic_input,
+)
+from sheet_snapshots import SnapshotWorkbook
+
+BASELINE_PATH = BASELINE_DIR / "extract-data.json"
+SHEETS = ["Capabilities", "Observables", "AntiPatterns", "CalibrationSignals", "Playbooks",
+          "RubricAnchors", "EvidenceTypes_Ref", "Crosswalk", "Coverage_Plan"]
+
+
+def synthetic_workbook(scale, seed):
+    return synthetic_input("generate-synthetic-matrix.py", f"matrix-x{scale:g}-seed{seed}.xlsx",
+                           ["--scale", str(scale), "--seed", str(seed)])
+
+
+def count_rows(xlsx, snapshot_dir):
+    with SnapshotWorkbook(xlsx, snapshot_dir=snapshot_dir) as wb:
+        return sum(sum(1 for _ in wb.iter_rows(sheet)) - 1 for sheet in SHEETS)
+
+
+def bench_scale(scale, seed, jobs, repeat):
+    xlsx = synthetic_workbook(scale, seed)
+    cold, warm, rss = [], [], 0
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            common = ["--xlsx", str(xlsx), "--out-dir", str(tmp / "out"),
+                      "--cache-dir", str(tmp / "cache"), "--jobs", str(jobs)]
+            seconds, peak = run_script("extract-data.py", common)
+            cold.append(seconds)
+            rss = max(rss, peak)
+            seconds, peak = run_script("extract-data.py", common + ["--force"])
+            warm.append(seconds)
+            rss = max(rss, peak)
+            rows = count_rows(xlsx, tmp / "cache" / "sheet-snapshots")
+    cold_s, warm_s = min(cold), min(warm)
+    return {
+        "rows": rows,
+        "coldSeconds": round(cold_s, 3),
+        "warmSeconds": round(warm_s, 3),
+        "coldRowsPerSecond": round(rows / cold_s, 1),
+        "warmRowsPerSecond": round(rows / warm_s, 1),
+        "peakRssKb": rss,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1,10",
+                        help="comma-separated workbook scales (default: 1,10)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=1, help="passed to extract-data.py --jobs")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per scale; the fastest is kept (default: 3)")
+    add_baseline_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args(argv)
+    baseline, tolerance = load_baseline(args)
+
+    results = {}
+    for scale in (float(s) for s in args.scales.split(",")):
+        key = f"{scale:g}"
+        results[key] = bench_scale(scale, args.seed, args.jobs, args.repeat)
+        r = results[key]
+        print(f"x{key:<5} {r['rows']:>8} rows | cold {r['coldSeconds']:7.3f}s "
+              f"({r['coldRowsPerSecond']:>9.1f} rows/s) | warm {r['warmSeconds']:7.3f}s "
+              f"({r['warmRowsPerSecond']:>9.1f} rows/s) | peak RSS {r['peakRssKb'] / 1024:.1f} MB")
+
+    report(args, "scales", results, baseline, tolerance,
+           ["coldRowsPerSecond", "warmRowsPerSecond"], settings={"jobs": args.jobs},
+           label="x{}")
+
+
+if __name__ == "__main__":
+    main()
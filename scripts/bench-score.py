@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark score-articles.py against synthetic article corpora.
+
+For each size, a synthetic JSON Lines index is generated (and cached) with
+generate-synthetic-articles.py, then scored from scratch (--no-cache) into a
+scratch directory. Each run records wall time, articles per second and the
+scorer's peak RSS. Results are compared against the stored baseline and the
+script exits non-zero when throughput drops, or memory grows, by more than
+the tolerance.
+
+Extra arguments after -- go to score-articles.py, so the batch, parallel
+and BM25 paths can be benchmarked too (keep their baselines in separate
+files with --baseline).
+
+Usage:
+    python3 scripts/bench-score.py                      # 10k and 100k articles
+    python3 scripts/bench-score.py --sizes 10k,100k,1M
+    python3 scripts/bench-score.py --update-baseline
+    python3 scripts/bench-score.py --baseline /tmp/batch.json -- --batch
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from bench_common import (
+    BASELINE_DIR,
+    add_baseline_arguments,
+    load_baseline,
+    parse_count,
+    report,
+    run_script,
+    synthetic_input,
+)
+
+BASELINE_PATH = BASELINE_DIR / "score-articles.json"
+
+
+def synthetic_corpus(count, seed):
+    return synthetic_input("generate-synthetic-articles.py", f"articles-{count}-seed{seed}.jsonl",
+                           ["--count", str(count), "--seed", str(seed)])
+
+
+def bench_size(count, seed, repeat, score_args):
+    corpus = synthetic_corpus(count, seed)
+    runs, rss = [], 0
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            seconds, peak = run_script("score-articles.py", [
+                "--input", str(corpus), "--output", str(Path(tmp) / "scored.jsonl"),
+                "--no-cache", *score_args])
+        runs.append(seconds)
+        rss = max(rss, peak)
+    seconds = min(runs)
+    return {
+        "articles": count,
+        "seconds": round(seconds, 3),
+        "articlesPerSecond": round(count / seconds, 1),
+        "peakRssKb": rss,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10k,100k",
+                        help="comma-separated corpus sizes (default: 10k,100k)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per size; the fastest is kept (default: 3)")
+    add_baseline_arguments(parser, BASELINE_PATH)
+    parser.add_argument("score_args", nargs="*",
+                        help="extra score-articles.py arguments, after --")
+    args = parser.parse_args(argv)
+    baseline, tolerance = load_baseline(args)
+
+    results = {}
+    for size in args.sizes.split(","):
+        key = size.strip()
+        results[key] = bench_size(parse_count(key), args.seed, args.repeat, args.score_args)
+        r = results[key]
+        print(f"{key:>6} {r['articles']:>9} articles | {r['seconds']:8.3f}s "
+              f"({r['articlesPerSecond']:>9.1f} articles/s) | "
+              f"peak RSS {r['peakRssKb'] / 1024:.1f} MB")
+
+    report(args, "sizes", results, baseline, tolerance, ["articlesPerSecond"],
+           settings={"scoreArgs": args.score_args})
+
+
+if __name__ == "__main__":
+    main()
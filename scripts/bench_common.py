@@ -0,0 +1,138 @@
+"""Shared plumbing for the bench-*.py benchmark scripts.
+
+Each benchmark times one of the pipeline scripts in a subprocess, keeps
+its results in a JSON baseline under reference/benchmarks/, and fails when
+throughput drops, or peak RSS grows, by more than a tolerance:
+
+    from bench_common import add_baseline_arguments, load_baseline, report, run_script
+
+    add_baseline_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args(argv)
+    baseline, tolerance = load_baseline(args)
+    seconds, peak_rss_kb = run_script("score-articles.py", ["--no-cache"])
+    report(args, "sizes", results, baseline, tolerance, ["articlesPerSecond"])
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+ROOT = SCRIPTS_DIR.parent
+BASELINE_DIR = ROOT / "reference" / "benchmarks"
+SYNTHETIC_DIR = ROOT / ".cache" / "synthetic"
+DEFAULT_TOLERANCE = 0.25
+
+
+def parse_count(text):
+    """Parse an article count such as ``2500``, ``10k`` or ``1M``."""
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip("km")) * scale)
+
+
+def synthetic_input(script, name, args):
+    """Return SYNTHETIC_DIR/``name``, generating it with a generate-synthetic-*.py script first.
+
+    Inputs are cached across runs, so only the first benchmark at a scale
+    pays for generating it.
+    """
+    path = SYNTHETIC_DIR / name
+    if not path.exists():
+        subprocess.run([sys.executable, str(SCRIPTS_DIR / script), *args,
+                        "--output", str(path)],
+                       check=True, stdout=subprocess.DEVNULL)
+    return path
+
+
+def run_script(script, args):
+    """Run a script in scripts/ and return (wall seconds, peak RSS in KB) of that process.
+
+    os.wait4 reports the child's own peak RSS, which the benchmarking
+    process's resource usage would otherwise fold in with its own.
+    """
+    started = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, str(SCRIPTS_DIR / script), *args],
+                            stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    seconds = time.perf_counter() - started
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise SystemExit(f"{script} {' '.join(args)} exited with {proc.returncode}")
+    return seconds, usage.ru_maxrss
+
+
+def add_baseline_arguments(parser, baseline_path):
+    """Add --tolerance, --baseline and --update-baseline to a benchmark's parser."""
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help=f"allowed fractional regression "
+                             f"(default: the baseline's, or {DEFAULT_TOLERANCE})")
+    parser.add_argument("--baseline", type=Path, default=baseline_path)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline instead of comparing")
+
+
+def load_baseline(args):
+    """Return the stored baseline ({} if none) and the tolerance to compare with."""
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    tolerance = (args.tolerance if args.tolerance is not None
+                 else baseline.get("tolerance", DEFAULT_TOLERANCE))
+    return baseline, tolerance
+
+
+def regressions(results, base_results, metrics, tolerance, label="{}"):
+    """Return human-readable regressions of ``results`` against ``base_results``.
+
+    ``metrics`` are throughput metrics, where lower is worse; ``peakRssKb``
+    is always checked too, where higher is worse. ``label`` formats each
+    result's key for the messages.
+    """
+    problems = []
+    for key, result in results.items():
+        base = base_results.get(key)
+        if not base:
+            continue
+        name = label.format(key)
+        for metric in metrics:
+            floor = base[metric] * (1 - tolerance)
+            if result[metric] < floor:
+                problems.append(f"{name} {metric}: {result[metric]} < {floor:.1f} "
+                                f"(baseline {base[metric]})")
+        ceiling = base["peakRssKb"] * (1 + tolerance)
+        if result["peakRssKb"] > ceiling:
+            problems.append(f"{name} peakRssKb: {result['peakRssKb']} > {ceiling:.0f} "
+                            f"(baseline {base['peakRssKb']})")
+    return problems
+
+
+def report(args, section, results, baseline, tolerance, metrics, settings=None, label="{}"):
+    """Store ``results`` as the baseline, or compare against it and exit 1 on a regression.
+
+    ``section`` is the baseline key the results are kept under ("scales",
+    "sizes"); ``settings`` are recorded alongside them when the baseline is
+    updated, so a later comparison can tell how it was produced.
+    """
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {
+            "tolerance": tolerance,
+            **(settings or {}),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            section: {**baseline.get(section, {}), **results},
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    problems = regressions(results, baseline.get(section, {}), metrics, tolerance, label)
+    if problems:
+        print(f"\nREGRESSION (tolerance {tolerance:.0%}):")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print(f"\nNo regressions against {args.baseline} (tolerance {tolerance:.0%}).")
@@ -1,15 +1,39 @@
 #!/usr/bin/env python3
 """Extract XLSX data into structured JSON files for the Astro site."""
 
+import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
-import openpyxl
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+import matrix_sqlite
+from matrix_index import MatrixIndex
+from sheet_snapshots import SNAPSHOT_DIR, SnapshotWorkbook, sheet_digests, workbook_digest
 
 XLSX_PATH = Path(__file__).parent.parent / "reference" / "em_director_matrix_v6.xlsx"
 OUT_DIR = Path(__file__).parent.parent / "src" / "data"
+MANIFEST_PATH = Path(__file__).parent.parent / ".cache" / "extract-data" / "manifest.json"
+PROFILE_REPORT = "extract-profile.json"
+# Where --profile writes its report unless given a path; kept out of OUT_DIR,
+# which only holds the shipped data
+PROFILE_PATH = MANIFEST_PATH.parent / PROFILE_REPORT
+# Sources whose changes invalidate the manifest, besides the workbook itself
+PIPELINE_SOURCES = [Path(__file__), Path(__file__).parent / "matrix_index.py",
+                    Path(__file__).parent / "matrix_sqlite.py"]
 
 
 def slugify(text: str) -> str:
@@ -22,22 +46,67 @@ def slugify(text: str) -> str:
     return text.strip("-")
 
 
+def open_workbook(path, digests=None, snapshot_dir=None):
+    """Open a workbook whose raw sheets come from snapshots when fresh.
+
+    Sheets without a snapshot are parsed read-only, with cached cell values
+    instead of formulas, and snapshotted as they stream past.
+    """
+    return SnapshotWorkbook(path, digests, snapshot_dir or SNAPSHOT_DIR)
+
+
 def read_sheet(wb, sheet_name):
-    """Read a sheet into a list of dicts using the first row as headers."""
-    ws = wb[sheet_name]
-    rows = list(ws.iter_rows(values_only=True))
-    if not rows:
-        return []
-    headers = [str(h).strip() if h else f"col_{i}" for i, h in enumerate(rows[0])]
-    data = []
-    for row in rows[1:]:
+    """Return a sheet's headers and a lazy iterator over its non-blank rows.
+
+    Rows stay raw value tuples, padded to the header width, and are pulled
+    lazily from the sheet's snapshot or read-only worksheet so peak memory
+    stays flat however long the sheet is.
+    """
+    rows = wb.iter_rows(sheet_name)
+    first = next(rows, None)
+    if first is None:
+        return [], iter(())
+    headers = [str(h).strip() if h else f"col_{i}" for i, h in enumerate(first)]
+    return headers, _padded_rows(rows, len(headers))
+
+
+def _padded_rows(rows, width):
+    padding = (None,) * width
+    for row in rows:
         if all(v is None for v in row):
             continue
-        entry = {}
-        for h, v in zip(headers, row):
-            entry[h] = v
-        data.append(entry)
-    return data
+        if len(row) < width:
+            row = row + padding[len(row):]
+        yield row
+
+
+def compile_row_mapper(headers, columns):
+    """Compile a converter from raw row tuples to a tuple of field values.
+
+    ``columns`` is a sequence of ``(header, convert)`` pairs. Header names are
+    resolved to column indexes once per sheet and baked into a generated
+    function, so each row is converted positionally without building a dict
+    or hashing header names. A header missing from the sheet converts as if
+    every cell in it were empty (the last duplicate header wins, as before).
+    """
+    index = {h: i for i, h in enumerate(headers)}
+    namespace = {}
+    fields = []
+    for n, (header, convert) in enumerate(columns):
+        if header in index:
+            namespace[f"f{n}"] = convert
+            fields.append(f"f{n}(row[{index[header]}])")
+        else:
+            namespace[f"d{n}"] = convert(None)
+            fields.append(f"d{n}")
+    exec(f"def convert(row):\n    return ({', '.join(fields)},)\n", namespace)
+    return namespace["convert"]
+
+
+def map_rows(sheet, columns):
+    """Lazily convert a (headers, rows) sheet with a compiled row mapper."""
+    headers, rows = sheet
+    return map(compile_row_mapper(headers, columns), rows)
 
 
 def split_semicolons(val):
@@ -74,195 +143,302 @@ def safe_str(val, default=""):
     return str(val).strip()
 
 
-def extract_capabilities(raw):
+def to_percent(val):
+    """Convert a value such as "62%" to a float percentage."""
+    return to_float(str(val).replace("%", ""))
+
+
+CAPABILITY_COLUMNS = (
+    ("CapabilityID", safe_str),
+    ("Name", safe_str),
+    ("Domain", safe_str),
+    ("Description", safe_str),
+    ("PrimarySubTopics", split_semicolons),
+    ("ObservableCount", to_int),
+    ("V5Status", safe_str),
+)
+
+
+def extract_capabilities(sheet):
     """Extract and structure capabilities."""
     caps = []
-    for r in raw:
-        cap_id = safe_str(r.get("CapabilityID"))
-        name = safe_str(r.get("Name"))
+    for (cap_id, name, domain, description, sub_topics, observable_count,
+         v5_status) in map_rows(sheet, CAPABILITY_COLUMNS):
         caps.append({
             "id": cap_id,
             "name": name,
             "slug": slugify(name),
-            "domain": safe_str(r.get("Domain")),
-            "description": safe_str(r.get("Description")),
-            "primarySubTopics": split_semicolons(r.get("PrimarySubTopics")),
-            "observableCount": to_int(r.get("ObservableCount")),
-            "v5Status": safe_str(r.get("V5Status")),
+            "domain": domain,
+            "description": description,
+            "primarySubTopics": sub_topics,
+            "observableCount": observable_count,
+            "v5Status": v5_status,
         })
     return caps
 
 
-def extract_observables(raw):
+OBSERVABLE_COLUMNS = (
+    ("ObservableID", safe_str),
+    ("CapabilityID", safe_str),
+    ("ShortText", safe_str),
+    ("FullExample", safe_str),
+    ("EvidenceTypes", split_semicolons),
+    ("DefaultWeight", to_float),
+    ("RequiredFrequency", safe_str),
+    ("EMRelevance", safe_str),
+    ("DirectorRelevance", safe_str),
+    ("LevelNotes", safe_str),
+    ("Why", safe_str),
+    ("How", safe_str),
+    ("ExpectedResult", safe_str),
+    ("Status", safe_str),
+)
+
+
+def extract_observables(sheet):
     """Extract and structure observables."""
     obs = []
-    for r in raw:
-        obs_id = safe_str(r.get("ObservableID"))
-        short = safe_str(r.get("ShortText"))
+    for (obs_id, cap_id, short, full_example, evidence_types, weight, frequency,
+         em_relevance, director_relevance, level_notes, why, how, expected,
+         status) in map_rows(sheet, OBSERVABLE_COLUMNS):
         obs.append({
             "id": obs_id,
-            "capabilityId": safe_str(r.get("CapabilityID")),
+            "capabilityId": cap_id,
             "shortText": short,
             "slug": slugify(short) if short else slugify(obs_id),
-            "fullExample": safe_str(r.get("FullExample")),
-            "evidenceTypes": split_semicolons(r.get("EvidenceTypes")),
-            "defaultWeight": to_float(r.get("DefaultWeight")),
-            "requiredFrequency": safe_str(r.get("RequiredFrequency")),
-            "emRelevance": safe_str(r.get("EMRelevance")),
-            "directorRelevance": safe_str(r.get("DirectorRelevance")),
-            "levelNotes": safe_str(r.get("LevelNotes")),
-            "why": safe_str(r.get("Why")),
-            "how": safe_str(r.get("How")),
-            "expectedResult": safe_str(r.get("ExpectedResult")),
-            "status": safe_str(r.get("Status")),
+            "fullExample": full_example,
+            "evidenceTypes": evidence_types,
+            "defaultWeight": weight,
+            "requiredFrequency": frequency,
+            "emRelevance": em_relevance,
+            "directorRelevance": director_relevance,
+            "levelNotes": level_notes,
+            "why": why,
+            "how": how,
+            "expectedResult": expected,
+            "status": status,
             "calibrationSignals": [],  # populated later
         })
     return obs
 
 
-def extract_anti_patterns(raw):
+ANTI_PATTERN_COLUMNS = (
+    ("AntiPatternID", safe_str),
+    ("ShortDesc", safe_str),
+    ("ObservableIDs", split_semicolons),
+    ("CapabilityID", safe_str),
+    ("WarningSigns", safe_str),
+    ("Impact", safe_str),
+    ("RecoveryActions", safe_str),
+    ("SourceTopic", safe_str),
+    ("MappingNotes", safe_str),
+)
+
+
+def extract_anti_patterns(sheet):
     """Extract and structure anti-patterns."""
     aps = []
-    for r in raw:
-        ap_id = safe_str(r.get("AntiPatternID"))
-        short = safe_str(r.get("ShortDesc"))
+    for (ap_id, short, observable_ids, cap_id, warning_signs, impact, recovery,
+         source_topic, mapping_notes) in map_rows(sheet, ANTI_PATTERN_COLUMNS):
         # ShortDesc format: "Name — Description". Extract just the name for slug.
         name_part = short.split("—")[0].strip() if "—" in short else short
         aps.append({
             "id": ap_id,
             "name": name_part,
             "slug": slugify(name_part) if name_part else slugify(ap_id),
-            "observableIds": split_semicolons(r.get("ObservableIDs")),
-            "capabilityId": safe_str(r.get("CapabilityID")),
+            "observableIds": observable_ids,
+            "capabilityId": cap_id,
             "shortDesc": short,
-            "warningSigns": safe_str(r.get("WarningSigns")),
-            "impact": safe_str(r.get("Impact")),
-            "recoveryActions": safe_str(r.get("RecoveryActions")),
-            "sourceTopic": safe_str(r.get("SourceTopic")),
-            "mappingNotes": safe_str(r.get("MappingNotes")),
+            "warningSigns": warning_signs,
+            "impact": impact,
+            "recoveryActions": recovery,
+            "sourceTopic": source_topic,
+            "mappingNotes": mapping_notes,
         })
     return aps
 
 
-def extract_calibration_signals(raw):
+SIGNAL_COLUMNS = (
+    ("SignalID", safe_str),
+    ("ObservableID", safe_str),
+    ("CapabilityID", safe_str),
+    ("SignalText", safe_str),
+    ("SignalType", safe_str),
+    ("SourceSubTopic", safe_str),
+)
+
+
+def extract_calibration_signals(sheet):
     """Extract and structure calibration signals."""
     sigs = []
-    for r in raw:
-        sig_id = safe_str(r.get("SignalID"))
+    for (sig_id, obs_id, cap_id, text, signal_type,
+         source_sub_topic) in map_rows(sheet, SIGNAL_COLUMNS):
         sigs.append({
             "id": sig_id,
-            "observableId": safe_str(r.get("ObservableID")),
-            "capabilityId": safe_str(r.get("CapabilityID")),
-            "signalText": safe_str(r.get("SignalText")),
-            "signalType": safe_str(r.get("SignalType")),
-            "sourceSubTopic": safe_str(r.get("SourceSubTopic")),
+            "observableId": obs_id,
+            "capabilityId": cap_id,
+            "signalText": text,
+            "signalType": signal_type,
+            "sourceSubTopic": source_sub_topic,
         })
     return sigs
 
 
-def extract_playbooks(raw):
+PLAYBOOK_COLUMNS = (
+    ("PlaybookID", safe_str),
+    ("Title", safe_str),
+    ("ObservableIDs", split_semicolons),
+    ("CapabilityIDs", split_semicolons),
+    ("Context", safe_str),
+    ("TopicsActivated", split_semicolons),
+    ("DecisionFramework", safe_str),
+    ("CommonMistakes", safe_str),
+    ("WhatGoodLooksLike", safe_str),
+    ("MappingNotes", safe_str),
+)
+
+
+def extract_playbooks(sheet):
     """Extract and structure playbooks."""
     pbs = []
-    for r in raw:
-        pb_id = safe_str(r.get("PlaybookID"))
-        title = safe_str(r.get("Title"))
+    for (pb_id, title, observable_ids, capability_ids, context, topics,
+         decision_framework, common_mistakes, what_good_looks_like,
+         mapping_notes) in map_rows(sheet, PLAYBOOK_COLUMNS):
         pbs.append({
             "id": pb_id,
             "slug": slugify(title) if title else slugify(pb_id),
-            "observableIds": split_semicolons(r.get("ObservableIDs")),
-            "capabilityIds": split_semicolons(r.get("CapabilityIDs")),
+            "observableIds": observable_ids,
+            "capabilityIds": capability_ids,
             "title": title,
-            "context": safe_str(r.get("Context")),
-            "topicsActivated": split_semicolons(r.get("TopicsActivated")),
-            "decisionFramework": safe_str(r.get("DecisionFramework")),
-            "commonMistakes": safe_str(r.get("CommonMistakes")),
-            "whatGoodLooksLike": safe_str(r.get("WhatGoodLooksLike")),
-            "mappingNotes": safe_str(r.get("MappingNotes")),
+            "context": context,
+            "topicsActivated": topics,
+            "decisionFramework": decision_framework,
+            "commonMistakes": common_mistakes,
+            "whatGoodLooksLike": what_good_looks_like,
+            "mappingNotes": mapping_notes,
         })
     return pbs
 
 
-def extract_rubric_anchors(raw):
+RUBRIC_ANCHOR_COLUMNS = (
+    ("CapabilityID", safe_str),
+    ("SourceTopic", safe_str),
+    ("Level1_Developing", safe_str),
+    ("Level3_Competent", safe_str),
+    ("Level5_Advanced", safe_str),
+    ("Rationale", safe_str),
+)
+
+
+def extract_rubric_anchors(sheet):
     """Extract and structure rubric anchors."""
     anchors = []
-    for r in raw:
+    for (cap_id, source_topic, level1, level3, level5,
+         rationale) in map_rows(sheet, RUBRIC_ANCHOR_COLUMNS):
         anchors.append({
-            "capabilityId": safe_str(r.get("CapabilityID")),
-            "sourceTopic": safe_str(r.get("SourceTopic")),
-            "level1Developing": safe_str(r.get("Level1_Developing")),
-            "level3Competent": safe_str(r.get("Level3_Competent")),
-            "level5Advanced": safe_str(r.get("Level5_Advanced")),
-            "rationale": safe_str(r.get("Rationale")),
+            "capabilityId": cap_id,
+            "sourceTopic": source_topic,
+            "level1Developing": level1,
+            "level3Competent": level3,
+            "level5Advanced": level5,
+            "rationale": rationale,
         })
     return anchors
 
 
-def extract_evidence_types(raw):
+EVIDENCE_TYPE_COLUMNS = (
+    ("TypeKey", safe_str),
+    ("DisplayName", safe_str),
+    ("Description", safe_str),
+    ("EvidenceStrength", safe_str),
+    ("UsageCount", to_int),
+)
+
+
+def extract_evidence_types(sheet):
     """Extract and structure evidence types."""
     evts = []
-    for r in raw:
-        key = safe_str(r.get("TypeKey"))
+    for (key, display_name, description, strength,
+         usage_count) in map_rows(sheet, EVIDENCE_TYPE_COLUMNS):
         evts.append({
             "typeKey": key,
             "slug": slugify(key),
-            "displayName": safe_str(r.get("DisplayName")),
-            "description": safe_str(r.get("Description")),
-            "evidenceStrength": safe_str(r.get("EvidenceStrength")),
-            "usageCount": to_int(r.get("UsageCount")),
+            "displayName": display_name,
+            "description": description,
+            "evidenceStrength": strength,
+            "usageCount": usage_count,
         })
     return evts
 
 
-def extract_crosswalk(raw):
+CROSSWALK_COLUMNS = (
+    ("OrigTopic", safe_str),
+    ("OrigPrinciple", safe_str),
+    ("OrigSubTopic", safe_str),
+    ("PrimaryCapability", safe_str),
+    ("SecondaryCapability", safe_str),
+    ("MappingNotes", safe_str),
+    ("ObservableID", safe_str),
+)
+
+
+def extract_crosswalk(sheet):
     """Extract and structure crosswalk."""
     entries = []
-    for r in raw:
+    for (topic, principle, sub_topic, primary, secondary, mapping_notes,
+         obs_id) in map_rows(sheet, CROSSWALK_COLUMNS):
         entries.append({
-            "origTopic": safe_str(r.get("OrigTopic")),
-            "origPrinciple": safe_str(r.get("OrigPrinciple")),
-            "origSubTopic": safe_str(r.get("OrigSubTopic")),
-            "primaryCapability": safe_str(r.get("PrimaryCapability")),
-            "secondaryCapability": safe_str(r.get("SecondaryCapability")),
-            "mappingNotes": safe_str(r.get("MappingNotes")),
-            "observableId": safe_str(r.get("ObservableID")),
+            "origTopic": topic,
+            "origPrinciple": principle,
+            "origSubTopic": sub_topic,
+            "primaryCapability": primary,
+            "secondaryCapability": secondary,
+            "mappingNotes": mapping_notes,
+            "observableId": obs_id,
         })
     return entries
 
 
-def extract_coverage(raw):
+COVERAGE_COLUMNS = (
+    ("CapabilityID", safe_str),
+    ("Name", safe_str),
+    ("Domain", safe_str),
+    ("PrimarySubTopics", to_int),
+    ("Observables", to_int),
+    ("Coverage%", to_percent),
+)
+
+
+def extract_coverage(sheet):
     """Extract and structure coverage data."""
     items = []
-    for r in raw:
+    for (cap_id, name, domain, sub_topics, observables,
+         coverage) in map_rows(sheet, COVERAGE_COLUMNS):
         items.append({
-            "capabilityId": safe_str(r.get("CapabilityID")),
-            "name": safe_str(r.get("Name")),
-            "domain": safe_str(r.get("Domain")),
-            "primarySubTopics": to_int(r.get("PrimarySubTopics")),
-            "observables": to_int(r.get("Observables")),
-            "coveragePercent": to_float(str(r.get("Coverage%", "0")).replace("%", "")),
+            "capabilityId": cap_id,
+            "name": name,
+            "domain": domain,
+            "primarySubTopics": sub_topics,
+            "observables": observables,
+            "coveragePercent": coverage,
         })
     return items
 
 
-def nest_signals_into_observables(observables, signals):
+def nest_signals_into_observables(observables, signals, index=None):
     """Nest calibration signals into their parent observables."""
-    sig_by_obs = {}
-    for sig in signals:
-        obs_id = sig["observableId"]
-        sig_by_obs.setdefault(obs_id, []).append(sig)
+    index = index or MatrixIndex(signals=signals)
     for obs in observables:
-        obs["calibrationSignals"] = sig_by_obs.get(obs["id"], [])
+        obs["calibrationSignals"] = index.signals_by_observable.get(obs["id"], [])
 
 
-def build_search_index(capabilities, observables, anti_patterns, playbooks):
+def build_search_index(capabilities, observables, anti_patterns, playbooks, index=None):
     """Build a flat search index across all entity types."""
-    index = []
-
-    # Build capability lookup
-    cap_map = {c["id"]: c for c in capabilities}
+    search = []
+    index = index or MatrixIndex(capabilities=capabilities)
 
     for cap in capabilities:
-        index.append({
+        search.append({
             "title": f"{cap['id']}: {cap['name']}",
             "description": cap["description"],
             "type": "capability",
@@ -273,8 +449,8 @@ def build_search_index(capabilities, observables, anti_patterns, playbooks):
         })
 
     for obs in observables:
-        cap = cap_map.get(obs["capabilityId"], {})
-        index.append({
+        cap = index.capability(obs["capabilityId"])
+        search.append({
             "title": f"{obs['id']}: {obs['shortText']}",
             "description": obs["fullExample"],
             "type": "observable",
@@ -285,8 +461,8 @@ def build_search_index(capabilities, observables, anti_patterns, playbooks):
         })
 
     for ap in anti_patterns:
-        cap = cap_map.get(ap["capabilityId"], {})
-        index.append({
+        cap = index.capability(ap["capabilityId"])
+        search.append({
             "title": f"{ap['id']}: {ap['shortDesc']}",
             "description": ap["warningSigns"],
             "type": "anti-pattern",
@@ -297,81 +473,435 @@ def build_search_index(capabilities, observables, anti_patterns, playbooks):
         })
 
     for pb in playbooks:
-        cap_names = [cap_map.get(cid, {}).get("name", "") for cid in pb["capabilityIds"]]
-        domains = list(set(cap_map.get(cid, {}).get("domain", "") for cid in pb["capabilityIds"]))
-        index.append({
+        domains = index.capability_domains(pb["capabilityIds"])
+        search.append({
             "title": f"{pb['id']}: {pb['title']}",
             "description": pb["context"],
             "type": "playbook",
             "url": f"/playbooks/{pb['slug']}/",
             "domain": domains[0] if domains else "",
-            "capabilityName": ", ".join(cap_names),
+            "capabilityName": ", ".join(index.capability_names(pb["capabilityIds"])),
             "id": pb["id"],
         })
 
-    return index
+    return search
+
+
+def observables_with_signals(observables, signals, index=None):
+    """Return observables with their calibration signals nested in."""
+    nest_signals_into_observables(observables, signals, index)
+    return observables
+
+
+def as_is(records, index=None):
+    """Return a sheet's records unchanged."""
+    return records
+
+
+def build_index(records):
+    """Build the shared foreign-key index over whichever entity sheets are resident."""
+    return MatrixIndex(
+        capabilities=records.get("Capabilities", ()),
+        observables=records.get("Observables", ()),
+        signals=records.get("CalibrationSignals", ()),
+        anti_patterns=records.get("AntiPatterns", ()),
+        playbooks=records.get("Playbooks", ()),
+    )
+
+
+def check_observable_counts(index, records):
+    """Warn where declared observable counts disagree with the observables sheet."""
+    if "Capabilities" not in records or "Observables" not in records:
+        return
+    counts = index.coverage_counts()
+    declared = [(c["id"], c["observableCount"], "Capabilities") for c in records["Capabilities"]]
+    declared += [(c["capabilityId"], c["observables"], "Coverage_Plan")
+                 for c in records.get("Coverage_Plan", ())]
+    for cap_id, count, sheet in declared:
+        actual = counts.get(cap_id, {}).get("observables", 0)
+        if count != actual:
+            print(f"  WARNING: {sheet} lists {count} observables for {cap_id}, "
+                  f"but Observables has {actual}")
+
+
+# Sheet name → transform producing that sheet's records
+SHEET_TRANSFORMS = {
+    "Capabilities": extract_capabilities,
+    "Observables": extract_observables,
+    "AntiPatterns": extract_anti_patterns,
+    "CalibrationSignals": extract_calibration_signals,
+    "Playbooks": extract_playbooks,
+    "RubricAnchors": extract_rubric_anchors,
+    "EvidenceTypes_Ref": extract_evidence_types,
+    "Crosswalk": extract_crosswalk,
+    "Coverage_Plan": extract_coverage,
+}
+
+# Output file → (source sheets, builder called with their records in order)
+OUTPUTS = {
+    "capabilities.json": (("Capabilities",), as_is),
+    "observables.json": (("Observables", "CalibrationSignals"), observables_with_signals),
+    "anti-patterns.json": (("AntiPatterns",), as_is),
+    "calibration-signals.json": (("CalibrationSignals",), as_is),
+    "playbooks.json": (("Playbooks",), as_is),
+    "rubric-anchors.json": (("RubricAnchors",), as_is),
+    "evidence-types.json": (("EvidenceTypes_Ref",), as_is),
+    "crosswalk.json": (("Crosswalk",), as_is),
+    "coverage.json": (("Coverage_Plan",), as_is),
+    "search-index.json": (("Capabilities", "Observables", "AntiPatterns", "Playbooks"),
+                          build_search_index),
+}
+
+
+class Profiler:
+    """Record wall time, row throughput and peak memory for each phase.
+
+    Peak traced memory comes from tracemalloc and is reset at the start of
+    every phase, so phases must not nest. Peak RSS is the process-wide
+    high-water mark at the end of the phase. A disabled profiler records
+    nothing.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = []
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name, target=None):
+        """Time the enclosed block; set ``stats["rows"]`` to report throughput."""
+        stats = {"rows": None}
+        if not self.enabled:
+            yield stats
+            return
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        yield stats
+        seconds = time.perf_counter() - started
+        rows = stats["rows"]
+        self.phases.append({
+            "phase": name,
+            "target": target,
+            "seconds": round(seconds, 6),
+            "rows": rows,
+            "rowsPerSecond": round(rows / seconds, 1) if rows and seconds else None,
+            "peakTracedBytes": tracemalloc.get_traced_memory()[1],
+            "peakRssKb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+            "pid": os.getpid(),
+        })
+
+    def write_report(self, path, **meta):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            **meta,
+            "totalSeconds": round(sum(p["seconds"] for p in self.phases), 6),
+            "phases": self.phases,
+        }
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+class _RowCountingWorkbook:
+    """Wrap a workbook to count the raw rows read through it."""
+
+    def __init__(self, wb):
+        self.wb = wb
+        self.rows = 0
+
+    def iter_rows(self, sheet_name):
+        for row in self.wb.iter_rows(sheet_name):
+            self.rows += 1
+            yield row
+
 
+def transform_sheet(wb, sheet_name):
+    """Stream a sheet through its extract_* transform."""
+    return SHEET_TRANSFORMS[sheet_name](read_sheet(wb, sheet_name))
+
+
+def _profiled(task, phase, wb, sheet_name):
+    profiler = Profiler(enabled=True)
+    counter = _RowCountingWorkbook(wb)
+    with profiler.phase(phase, sheet_name) as stats:
+        result = task(counter, sheet_name)
+        stats["rows"] = counter.rows
+    return result, profiler.phases[0]
+
+
+def _run_in_worker(task, xlsx_path, digests, snapshot_dir, sheet_name):
+    wb = open_workbook(xlsx_path, digests, snapshot_dir)
+    try:
+        return task(wb, sheet_name)
+    finally:
+        wb.close()
+
+
+def run_per_sheet(task, sheet_names, digests, jobs=1, profiler=None, phase=None):
+    """Apply task(wb, sheet_name) to each sheet, keyed by sheet name.
+
+    With jobs > 1 the sheets are spread over a process pool; each worker
+    opens its own read-only workbook and results are joined in input order.
+    With an enabled profiler each sheet is timed as ``phase`` wherever it
+    runs, and the measurements are added to the profiler.
+    """
+    if not sheet_names:
+        return {}
+    profiling = profiler is not None and profiler.enabled
+    if profiling:
+        task = partial(_profiled, task, phase)
+    if jobs > 1 and len(sheet_names) > 1:
+        worker = partial(_run_in_worker, task, XLSX_PATH, digests, SNAPSHOT_DIR)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(sheet_names))) as pool:
+            results = dict(zip(sheet_names, pool.map(worker, sheet_names)))
+    else:
+        wb = open_workbook(XLSX_PATH, digests)
+        try:
+            results = {name: task(wb, name) for name in sheet_names}
+        finally:
+            wb.close()
+    if profiling:
+        profiler.phases.extend(entry for _, entry in results.values())
+        results = {name: result for name, (result, _) in results.items()}
+    return results
+
+
+# SQLite table → sheet whose records fill it
+SQLITE_TABLES = {
+    "capabilities": "Capabilities",
+    "observables": "Observables",
+    "calibration_signals": "CalibrationSignals",
+    "anti_patterns": "AntiPatterns",
+    "playbooks": "Playbooks",
+    "rubric_anchors": "RubricAnchors",
+    "evidence_types": "EvidenceTypes_Ref",
+    "crosswalk": "Crosswalk",
+    "coverage": "Coverage_Plan",
+}
+
+
+def file_digest(path):
+    """Return the SHA-256 digest of a file's bytes, or None if it is missing."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def pipeline_digest():
+    """Return a digest of the extraction code, so edits to it force a full run."""
+    digest = hashlib.sha256()
+    for path in PIPELINE_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_manifest():
+    """Load the previous run's manifest, discarding it if it no longer applies.
+
+    A manifest only applies to the same script source and output directory;
+    anything else forces a full extraction.
+    """
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"sheets": {}, "outputs": {}}
+    if (manifest.get("script") != pipeline_digest()
+            or manifest.get("outDir") != str(OUT_DIR.resolve())):
+        return {"sheets": {}, "outputs": {}}
+    return manifest
+
+
+def save_manifest(sheets, outputs, sqlite=None):
+    """Persist sheet, output and SQLite export digests for the next incremental run."""
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "script": pipeline_digest(),
+        "outDir": str(OUT_DIR.resolve()),
+        "sheets": sheets,
+        "outputs": outputs,
+        "sqlite": sqlite or {},
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def stale_outputs(manifest, digests):
+    """Return output files whose source sheets changed or whose file drifted."""
+    changed = {name for name, digest in digests.items()
+               if manifest["sheets"].get(name) != digest}
+    stale = []
+    for filename, (sources, _) in OUTPUTS.items():
+        recorded = manifest["outputs"].get(filename)
+        if (changed.intersection(sources) or recorded is None
+                or file_digest(OUT_DIR / filename) != recorded):
+            stale.append(filename)
+    return stale
+
+
+def extract(manifest, records, jobs=1, profile=None, sqlite_path=None):
+    """Run one incremental extraction pass and return the new manifest.
+
+    ``records`` maps sheet names to transformed records kept from earlier
+    passes. Entries for sheets whose content changed are dropped, sheets
+    feeding a stale output that are not resident get transformed, and the
+    dict is left holding everything transformed so far. With ``profile``
+    set to a path, per-phase and per-sheet measurements are written there.
+    With ``sqlite_path`` set, the database there
+    is rebuilt whenever it was not exported from the current sheets.
+    """
+    profiler = Profiler(enabled=profile is not None)
+
+    # Digest every sheet from its raw XML part in the zip, without parsing
+    # any cells, then stream only the sheets feeding a stale output through
+    # their transforms
+    with profiler.phase("hash", XLSX_PATH.name):
+        digests = sheet_digests(XLSX_PATH)
+    current = {name: digests[name] for name in SHEET_TRANSFORMS}
+    for name, sheet_hash in current.items():
+        if manifest["sheets"].get(name) != sheet_hash:
+            records.pop(name, None)
+    stale = stale_outputs(manifest, current)
+    sqlite_exports = dict(manifest.get("sqlite", {}))
+    sqlite_key = hashlib.sha256(json.dumps(current, sort_keys=True).encode()).hexdigest()
+    export_sqlite = sqlite_path is not None and (
+        sqlite_exports.get(str(sqlite_path)) != sqlite_key or not sqlite_path.exists())
+    needed = [name for name in SHEET_TRANSFORMS
+              if name not in records
+              and (export_sqlite or any(name in OUTPUTS[filename][0] for filename in stale))]
+    records.update(run_per_sheet(transform_sheet, needed, digests, jobs,
+                                 profiler, "transform"))
+    if stale or export_sqlite:
+        with profiler.phase("index"):
+            index = build_index(records)
+        check_observable_counts(index, records)
+
+    # Write stale outputs, skipping any that would come out byte-identical
+    output_digests = dict(manifest["outputs"])
+    written = 0
+    for filename in stale:
+        sources, build = OUTPUTS[filename]
+        with profiler.phase("build", filename) as stats:
+            data = build(*(records[name] for name in sources), index=index)
+            stats["rows"] = len(data)
+        with profiler.phase("write", filename) as stats:
+            content = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+            output_hash = hashlib.sha256(content).hexdigest()
+            path = OUT_DIR / filename
+            changed = file_digest(path) != output_hash
+            if changed:
+                path.write_bytes(content)
+            stats["rows"] = len(data)
+        if changed:
+            written += 1
+            print(f"  Wrote {filename}: {len(data)} entries")
+        else:
+            print(f"  Unchanged {filename}: {len(data)} entries")
+        output_digests[filename] = output_hash
+
+    if export_sqlite:
+        with profiler.phase("sqlite", sqlite_path.name) as stats:
+            matrix_sqlite.export(sqlite_path, {table: records[sheet]
+                                               for table, sheet in SQLITE_TABLES.items()})
+            stats["rows"] = sum(len(records[sheet]) for sheet in SQLITE_TABLES.values())
+        sqlite_exports[str(sqlite_path)] = sqlite_key
+        print(f"  Wrote {sqlite_path}")
+
+    skipped = len(OUTPUTS) - len(stale)
+    print(f"\nDone! {written} files written to {OUT_DIR} "
+          f"({len(needed)} sheets re-extracted, {skipped} outputs up to date)")
+    if profile is not None:
+        profiler.write_report(profile, workbook=str(XLSX_PATH),
+                              workbookDigest=workbook_digest(XLSX_PATH), jobs=jobs)
+        print(f"Profile written to {profile}")
+    return save_manifest(current, output_digests, sqlite_exports)
+
+
+def watch(manifest, jobs=1, interval=0.25, profile=None, sqlite_path=None):
+    """Poll the workbook's mtime and size, re-extracting whenever they change.
+
+    Transformed records stay resident between passes, so a change only
+    re-runs the transforms of sheets whose content actually changed.
+    """
+    records = {}
+    signature = None
+    print(f"Watching {XLSX_PATH} (Ctrl-C to stop)...")
+    try:
+        while True:
+            try:
+                stat = XLSX_PATH.stat()
+                current = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                current = None
+            if current is not None and current != signature:
+                # Only retried on the next change, which also covers a
+                # workbook caught half-way through being saved.
+                signature = current
+                started = time.perf_counter()
+                try:
+                    manifest = extract(manifest, records, jobs, profile, sqlite_path)
+                except Exception as e:
+                    print(f"ERROR: extraction failed: {e}", file=sys.stderr)
+                else:
+                    print(f"Extracted in {time.perf_counter() - started:.2f}s; watching...")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--xlsx", type=Path, default=XLSX_PATH,
+                        help="workbook to extract (default: the shipped matrix)")
+    parser.add_argument("--out-dir", type=Path, default=OUT_DIR,
+                        help="directory for the JSON outputs (default: src/data)")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help="directory for the manifest and sheet snapshots "
+                             "(default: .cache/ at the repo root)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the manifest and re-extract every sheet")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="parse and transform sheets in N worker processes "
+                             "(0 = one per CPU)")
+    parser.add_argument("--watch", action="store_true",
+                        help="stay resident and re-extract whenever the workbook changes")
+    parser.add_argument("--interval", type=float, default=0.25, metavar="SECONDS",
+                        help="how often --watch polls the workbook (default: 0.25)")
+    parser.add_argument("--profile", nargs="?", const=True, default=None, type=Path,
+                        metavar="PATH",
+                        help=f"record per-phase and per-sheet timings and memory to PATH "
+                             f"(default: {PROFILE_REPORT} in the cache directory; slower: "
+                             f"enables tracemalloc)")
+    parser.add_argument("--sqlite", type=Path, default=None, metavar="PATH",
+                        help="also export the matrix to a SQLite database with indexed "
+                             "foreign keys and FTS5 tables")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    global XLSX_PATH, OUT_DIR, MANIFEST_PATH, SNAPSHOT_DIR, PROFILE_PATH
+    args = parse_args(argv)
+    XLSX_PATH, OUT_DIR = args.xlsx, args.out_dir
+    if args.cache_dir:
+        MANIFEST_PATH = args.cache_dir / "extract-data" / "manifest.json"
+        SNAPSHOT_DIR = args.cache_dir / "sheet-snapshots"
+        PROFILE_PATH = args.cache_dir / "extract-data" / PROFILE_REPORT
+    profile = PROFILE_PATH if args.profile is True else args.profile
 
-def main():
     if not XLSX_PATH.exists():
         print(f"ERROR: XLSX file not found at {XLSX_PATH}", file=sys.stderr)
         sys.exit(1)
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {"sheets": {}, "outputs": {}} if args.force else load_manifest()
+    jobs = args.jobs or os.cpu_count() or 1
 
-    print(f"Loading {XLSX_PATH}...")
-    wb = openpyxl.load_workbook(XLSX_PATH, data_only=True)
-    print(f"Sheets: {wb.sheetnames}")
-
-    # Extract raw data from each sheet
-    raw_caps = read_sheet(wb, "Capabilities")
-    raw_obs = read_sheet(wb, "Observables")
-    raw_aps = read_sheet(wb, "AntiPatterns")
-    raw_sigs = read_sheet(wb, "CalibrationSignals")
-    raw_pbs = read_sheet(wb, "Playbooks")
-    raw_rubric = read_sheet(wb, "RubricAnchors")
-    raw_evidence = read_sheet(wb, "EvidenceTypes_Ref")
-    raw_crosswalk = read_sheet(wb, "Crosswalk")
-    raw_coverage = read_sheet(wb, "Coverage_Plan")
-
-    # Transform
-    capabilities = extract_capabilities(raw_caps)
-    observables = extract_observables(raw_obs)
-    anti_patterns = extract_anti_patterns(raw_aps)
-    signals = extract_calibration_signals(raw_sigs)
-    playbooks = extract_playbooks(raw_pbs)
-    rubric_anchors = extract_rubric_anchors(raw_rubric)
-    evidence_types = extract_evidence_types(raw_evidence)
-    crosswalk = extract_crosswalk(raw_crosswalk)
-    coverage = extract_coverage(raw_coverage)
-
-    # Nest signals into observables
-    nest_signals_into_observables(observables, signals)
-
-    # Build search index
-    search_index = build_search_index(capabilities, observables, anti_patterns, playbooks)
-
-    # Write JSON files
-    outputs = {
-        "capabilities.json": capabilities,
-        "observables.json": observables,
-        "anti-patterns.json": anti_patterns,
-        "calibration-signals.json": signals,
-        "playbooks.json": playbooks,
-        "rubric-anchors.json": rubric_anchors,
-        "evidence-types.json": evidence_types,
-        "crosswalk.json": crosswalk,
-        "coverage.json": coverage,
-        "search-index.json": search_index,
-    }
-
-    for filename, data in outputs.items():
-        path = OUT_DIR / filename
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"  Wrote {filename}: {len(data)} entries")
+    if args.watch:
+        watch(manifest, jobs, args.interval, profile, args.sqlite)
+        return
 
-    print(f"\nDone! {len(outputs)} files written to {OUT_DIR}")
+    print(f"Loading {XLSX_PATH}...")
+    extract(manifest, {}, jobs, profile, args.sqlite)
 
 
 if __name__ == "__main__":
@@ -2,117 +2,132 @@
 """
 Generate priority queue from scored articles.
 Sorts by: tier → capability coverage priority → relevance → word count → recency
-"""
-
-import json
-from datetime import datetime
-
-with open('reference/articles-scored.json') as f:
-    scored = json.load(f)
-
-# Capability coverage priority (lower coverage = higher priority)
-# From the plan's gap analysis
-CAPABILITY_PRIORITY = {
-    "C10": 1,  # 62% coverage
-    "C12": 1,  # 62% coverage
-    "C7":  2,  # 64% coverage
-    "C14": 2,  # 67% coverage
-    "C13": 3,  # 100% but new, low depth
-    "C2":  3,  # 100% but only 4 observables
-    "C8":  3,  # 100% but only 6 observables
-    "C11": 4,  # 80% coverage
-    "C4":  5,
-    "C9":  5,
-    "C1":  6,
-    "C3":  6,
-    "C5":  6,
-    "C6":  6,
-    "general": 7,
-}
-
-def parse_date(date_str):
-    """Parse date string, return sortable value (higher = more recent)."""
-    try:
-        return datetime.strptime(date_str[:10], '%Y-%m-%d').timestamp()
-    except (ValueError, TypeError):
-        return 0
-
-def sort_key(article):
-    """Sort key: lower = higher priority."""
-    # Tier (1 = highest priority)
-    relevance = article['relevance']
-    if relevance >= 4:
-        tier = 1
-    elif relevance == 3:
-        tier = 2
-    else:
-        tier = 3
-
-    # Capability priority (lower = higher priority)
-    cap = article['primaryCapability']
-    cap_priority = CAPABILITY_PRIORITY.get(cap, 7)
-
-    # Enrichment specificity: specific types > learning-resource only
-    etypes = article.get('enrichmentTypes', [])
-    specific_types = [e for e in etypes if e not in ('learning-resource',)]
-    enrichment_specificity = 0 if specific_types else 1
-
-    # Word count (higher = more substantive = higher priority)
-    word_count = -(article.get('wordCount', 0))
-
-    # Type priority: Report > Webinar > Talk/Video
-    type_priority = {"Report": 0, "Webinar": 1, "Guide": 1, "Deep Dive": 1,
-                     "Talk/Video": 2, "Huddle/Panel": 2}
-    article_type_priority = type_priority.get(article.get('type', ''), 3)
 
-    # Recency (negative timestamp = more recent = higher priority)
-    recency = -parse_date(article.get('date', ''))
+Input and output may be JSON Lines (.jsonl) or legacy JSON arrays.
 
-    return (tier, cap_priority, enrichment_specificity, -relevance,
-            article_type_priority, word_count, recency)
+With --incremental, only articles that were added, rescored or removed since
+the last run are moved in the persisted ranked queue, and the changes are
+appended to <output>.delta.jsonl instead of rewriting the whole queue file.
+The delta is folded back into the queue file (compacted) once it grows past
+a fifth of the queue, or on --compact. Readers should use
+priority_queue.load_queue(), which replays the delta.
 
-# Sort
-priority_queue = sorted(scored, key=sort_key)
-
-# Add rank and tier
-for i, article in enumerate(priority_queue):
-    article['rank'] = i + 1
-    if article['relevance'] >= 4:
-        article['tier'] = 1
-    elif article['relevance'] == 3:
-        article['tier'] = 2
-    else:
-        article['tier'] = 3
-
-# Save full queue
-with open('reference/articles-priority-queue.json', 'w') as f:
-    json.dump(priority_queue, f, indent=2)
-
-# ── Statistics ──────────────────────────────────────────────────────
-tier1 = [a for a in priority_queue if a['tier'] == 1]
-tier2 = [a for a in priority_queue if a['tier'] == 2]
-tier3 = [a for a in priority_queue if a['tier'] == 3]
-
-print(f"Priority Queue Generated: {len(priority_queue)} total articles")
-print(f"  Tier 1 (must review):  {len(tier1)}")
-print(f"  Tier 2 (review if time): {len(tier2)}")
-print(f"  Tier 3 (skip):         {len(tier3)}")
+With --shards, the ranked queue is also split into one JSON Lines shard per
+tier and primaryCapability plus a manifest.json of counts, rank ranges and
+hashes (see queue_shards.py), so consumers can read just the slice they
+need. Shards whose content didn't change are left untouched.
+"""
 
-print("\n── Tier 1 Breakdown by Primary Capability ──")
+import argparse
 from collections import Counter
-tier1_caps = Counter(a['primaryCapability'] for a in tier1)
-for cap, count in tier1_caps.most_common():
-    name = {"C1": "Org-Level Thinking", "C2": "Strategic Prioritization",
-            "C3": "Systems Design", "C4": "Operational Leadership",
-            "C5": "Cross-Functional Influence", "C6": "Coaching & Talent",
-            "C7": "Decision Framing", "C8": "Incidents & Reliability",
-            "C9": "Metrics & Measurement", "C10": "Resource Allocation",
-            "C11": "Hiring & Onboarding", "C12": "Culture & Norms",
-            "C13": "Security & Compliance", "C14": "Performance Mgmt"
-           }.get(cap, cap)
-    print(f"  {cap} ({name}): {count}")
-
-print("\n── Top 20 Articles in Queue ──")
-for a in priority_queue[:20]:
-    cap = a['primaryCapability']
-    print(f"  #{a['rank']:3d} [R{a['relevance']}] {cap:4s} | {a['title'][:60]:<60s} | {a['type']}")
+from pathlib import Path
+
+from article_io import read_records, write_records
+from priority_queue import (
+    RankedQueue,
+    delta_path,
+    load_queue,
+    ranked_entries,
+    state_path,
+)
+from queue_shards import write_shards
+
+INPUT_PATH = 'reference/articles-scored.json'
+OUTPUT_PATH = 'reference/articles-priority-queue.json'
+SHARDS_PATH = 'reference/priority-queue-shards'
+
+# Compact once the delta holds more ops than this share of the queue
+COMPACT_RATIO = 0.2
+
+
+def write_full(queue, output):
+    """Rewrite the queue file from ``queue`` and drop its delta."""
+    write_records(output, ranked_entries(queue))
+    delta_path(output).unlink(missing_ok=True)
+
+
+def update_incremental(scored, output, compact=False):
+    """Apply the changes in ``scored`` to the persisted queue.
+
+    Returns the queue, the delta ops applied and whether the queue file was
+    compacted.
+    """
+    delta = delta_path(output)
+    queue = RankedQueue.load(state_path(output), [output, delta])
+    if queue is None:
+        queue = load_queue(output)
+    ops = queue.sync(scored)
+    if ops:
+        write_records(delta, ops, append=True)
+    pending = sum(1 for _ in read_records(delta)) if delta.exists() else 0
+    compact = compact or pending > COMPACT_RATIO * len(queue)
+    if compact:
+        write_full(queue, output)
+    return queue, ops, compact
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", default=INPUT_PATH,
+                        help=f"scored articles (default: {INPUT_PATH})")
+    parser.add_argument("--output", default=OUTPUT_PATH,
+                        help="priority queue; a .jsonl path is written as JSON Lines "
+                             f"(default: {OUTPUT_PATH})")
+    parser.add_argument("--incremental", action="store_true",
+                        help="update the persisted queue with just the changed articles "
+                             "and append them to the delta file")
+    parser.add_argument("--compact", action="store_true",
+                        help="with --incremental, fold the delta into the queue file")
+    parser.add_argument("--shards", nargs="?", const=SHARDS_PATH, default=None, metavar="DIR",
+                        help="also write per-tier/per-capability shards and a manifest "
+                             f"(default DIR: {SHARDS_PATH})")
+    args = parser.parse_args()
+
+    scored = read_records(args.input)
+    if args.incremental and Path(args.output).exists():
+        queue, ops, compacted = update_incremental(scored, args.output, args.compact)
+        removed = sum(op['op'] == 'remove' for op in ops)
+        print(f"Incremental update: {len(ops) - removed} upserted, {removed} removed"
+              f"{' (compacted)' if compacted else ''}\n")
+    else:
+        # Sort and save the full queue
+        queue = RankedQueue(scored)
+        write_full(queue, args.output)
+    queue.save(state_path(args.output), [args.output, delta_path(args.output)])
+    priority_queue = list(ranked_entries(queue))
+    if args.shards:
+        manifest, written = write_shards(args.shards, priority_queue, source=args.output)
+        print(f"Shards: {len(written)} of {len(manifest['shards'])} written to {args.shards}\n")
+
+    # ── Statistics ──────────────────────────────────────────────────────
+    tier1 = [a for a in priority_queue if a['tier'] == 1]
+    tier2 = [a for a in priority_queue if a['tier'] == 2]
+    tier3 = [a for a in priority_queue if a['tier'] == 3]
+
+    print(f"Priority Queue Generated: {len(priority_queue)} total articles")
+    print(f"  Tier 1 (must review):  {len(tier1)}")
+    print(f"  Tier 2 (review if time): {len(tier2)}")
+    print(f"  Tier 3 (skip):         {len(tier3)}")
+
+    print("\n── Tier 1 Breakdown by Primary Capability ──")
+    tier1_caps = Counter(a['primaryCapability'] for a in tier1)
+    for cap, count in tier1_caps.most_common():
+        name = {"C1": "Org-Level Thinking", "C2": "Strategic Prioritization",
+                "C3": "Systems Design", "C4": "Operational Leadership",
+                "C5": "Cross-Functional Influence", "C6": "Coaching & Talent",
+                "C7": "Decision Framing", "C8": "Incidents & Reliability",
+                "C9": "Metrics & Measurement", "C10": "Resource Allocation",
+                "C11": "Hiring & Onboarding", "C12": "Culture & Norms",
+                "C13": "Security & Compliance", "C14": "Performance Mgmt"
+               }.get(cap, cap)
+        print(f"  {cap} ({name}): {count}")
+
+    print("\n── Top 20 Articles in Queue ──")
+    for a in priority_queue[:20]:
+        cap = a['primaryCapability']
+        print(f"  #{a['rank']:3d} [R{a['relevance']}] {cap:4s} | {a['title'][:60]:<60s} | {a['type']}")
+
+
+if __name__ == "__main__":
+    main()
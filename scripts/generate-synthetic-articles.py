@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic LeadDev-style article index of any size, for
+benchmarking score-articles.py.
+
+Articles have the same fields as reference/articles-index.json. Categories
+come from CATEGORY_CAPABILITY_MAP, and titles and descriptions mix filler
+words with keywords from the scoring tables, mostly those of the
+capabilities the category maps to, so relevance, capability and enrichment
+distributions look like the real corpus rather than all-miss noise. Output
+is JSON Lines, streamed, so a million articles never sit in memory.
+
+Usage:
+    python3 scripts/generate-synthetic-articles.py --count 100k
+    python3 scripts/generate-synthetic-articles.py --count 1M --output /tmp/articles-1m.jsonl
+"""
+
+import argparse
+import math
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+from article_io import write_records
+from article_scoring import (
+    CATEGORY_CAPABILITY_MAP,
+    ENRICHMENT_KEYWORDS,
+    KEYWORD_SCORES,
+    VALUE_SIGNALS,
+)
+from bench_common import parse_count
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "synthetic"
+
+# Share of each article type in the shipped index
+TYPES = {"Webinar": 1410, "Talk/Video": 1347, "Report": 75, "Deep Dive": 12,
+         "Huddle/Panel": 5, "Guide": 3}
+
+# Filler words that match no keyword, alone or in pairs
+FILLER = (
+    "how why what your team teams engineer engineers manager managers leader "
+    "lessons scaling running modern remote hybrid new first better great good "
+    "world year company startup people work working story journey panel "
+    "practical simple hard way ways"
+).split()
+
+# How often a title carries a keyword, the odds of 0-3 in a description and
+# the odds of a topical keyword coming from each weight group; tuned so the
+# relevance tiers come out close to the shipped index's
+TITLE_KEYWORD_RATE = 0.35
+DESCRIPTION_KEYWORDS = (6, 3, 1, 1)
+WEIGHT_ODDS = {1: 6, 2: 3, 3: 1}
+
+# Half the shipped articles have no word count; the rest centre on ~1,250
+NO_WORD_COUNT_RATE = 0.5
+MEDIAN_WORD_COUNT = 1250
+
+FIRST_DATE = date(2018, 1, 1)
+DATE_SPAN = 8 * 365
+
+
+def _vocabulary():
+    """Return {capability: {weight: keywords}} and the enrichment/value-signal keywords."""
+    by_cap = {cap: {w: [kw.rstrip("*") for kw in group] for w, group in groups.items()}
+              for cap, groups in KEYWORD_SCORES.items()}
+    extra = [kw.rstrip("*") for table in (ENRICHMENT_KEYWORDS, VALUE_SIGNALS)
+             for keywords in table.values() for kw in keywords]
+    return by_cap, extra
+
+
+def _topical_keyword(rng, groups):
+    weights = list(groups)
+    weight = rng.choices(weights, [WEIGHT_ODDS.get(w, 1) for w in weights])[0]
+    return rng.choice(groups[weight])
+
+
+def generate_articles(count, seed=0):
+    """Yield ``count`` synthetic articles."""
+    rng = random.Random(seed)
+    by_cap, extra = _vocabulary()
+    categories = list(CATEGORY_CAPABILITY_MAP)
+    # Categories that map to capabilities dominate, as in the real index
+    category_weights = [30 if CATEGORY_CAPABILITY_MAP[c] else 1 for c in categories]
+    types, type_weights = list(TYPES), list(TYPES.values())
+
+    for article_id in range(1, count + 1):
+        category = rng.choices(categories, category_weights)[0]
+        caps = CATEGORY_CAPABILITY_MAP[category] or list(by_cap)
+        groups = by_cap[rng.choice(caps)]
+
+        title = rng.choices(FILLER, k=rng.randint(2, 6))
+        if rng.random() < TITLE_KEYWORD_RATE:
+            title.insert(rng.randint(0, len(title)), _topical_keyword(rng, groups))
+        desc = rng.choices(FILLER, k=rng.randint(8, 20))
+        for _ in range(rng.choices((0, 1, 2, 3), DESCRIPTION_KEYWORDS)[0]):
+            desc.insert(rng.randint(0, len(desc)), _topical_keyword(rng, groups)
+                        if rng.random() < 0.5 else rng.choice(extra))
+        title = " ".join(title).capitalize()
+
+        article_type = rng.choices(types, type_weights)[0]
+        word_count = (0 if rng.random() < NO_WORD_COUNT_RATE
+                      else round(rng.lognormvariate(math.log(MEDIAN_WORD_COUNT), 0.35)))
+        yield {
+            "id": article_id,
+            "category": category,
+            "title": title,
+            "authors": f"Author {rng.randint(1, max(1, count // 10))}",
+            "date": (FIRST_DATE + timedelta(days=rng.randrange(DATE_SPAN))).isoformat(),
+            "type": article_type,
+            "wordCount": word_count,
+            "readTime": f"{max(1, word_count // 230)} min read" if word_count else "",
+            "url": f"https://example.com/articles/{article_id}",
+            "description": " ".join(desc).capitalize() + ".",
+        }
+
+
+def default_output(count, seed=0):
+    return CACHE_DIR / f"articles-{count}-seed{seed}.jsonl"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", default="10k",
+                        help="number of articles, e.g. 2500, 10k or 1M (default: 10k)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="where to write the JSON Lines index "
+                             "(default: .cache/synthetic/articles-<count>-seed<seed>.jsonl)")
+    args = parser.parse_args(argv)
+
+    count = parse_count(args.count)
+    path = args.output or default_output(count, args.seed)
+    write_records(path, generate_articles(count, args.seed))
+    print(f"Wrote {count} articles to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic matrix workbook at a configurable multiple of the
+shipped em_director_matrix_v6.xlsx, for benchmarking extract-data.py.
+
+The workbook has the same nine sheets and headers that extract-data.py reads,
+and its IDs are consistent: every observable belongs to a capability, every
+signal points at an existing observable (and that observable's capability),
+and anti-patterns, playbooks, crosswalk rows and coverage rows only reference
+capabilities and observables that exist.
+
+Usage:
+    python3 scripts/generate-synthetic-matrix.py --scale 10
+    python3 scripts/generate-synthetic-matrix.py --scale 100 --output /tmp/matrix-x100.xlsx
+"""
+
+import argparse
+import random
+from pathlib import Path
+
+import openpyxl
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "synthetic"
+
+# Row counts of the shipped workbook; --scale multiplies these
+BASE_COUNTS = {
+    "Capabilities": 14,
+    "Observables": 102,
+    "AntiPatterns": 27,
+    "CalibrationSignals": 144,
+    "Playbooks": 23,
+    "RubricAnchors": 16,
+    "EvidenceTypes_Ref": 24,
+    "Crosswalk": 137,
+}
+
+DOMAINS = ["Strategy", "Execution", "Stakeholder", "People", "Reliability", "Data"]
+FREQUENCIES = ["episodic", "quarterly", "monthly", "weekly", "continuous"]
+RELEVANCE = ["Low", "Medium", "High"]
+SIGNAL_TYPES = ["promo_packet", "metric", "peer_feedback", "manager_observation"]
+STRENGTHS = ["Low", "Medium", "High"]
+
+WORDS = (
+    "team teams engineer engineers manager director strategy roadmap incident "
+    "review design architecture delivery quality hiring onboarding coaching "
+    "feedback metrics outcomes stakeholder alignment priorities tradeoffs budget "
+    "headcount capacity culture norms trust safety security compliance risk "
+    "reliability calibration performance promotion growth career ownership "
+    "decision context clarity cadence planning retrospective process platform "
+    "migration debt velocity throughput adoption accountability escalation "
+    "documents writes defines drives measures shares aligns reduces improves "
+    "across within quarterly explicit sustainable cross-functional"
+).split()
+
+
+def sentence(rng, min_words, max_words):
+    words = rng.choices(WORDS, k=rng.randint(min_words, max_words))
+    return " ".join(words).capitalize() + "."
+
+
+def paragraph(rng, sentences=(1, 3), words=(8, 18)):
+    return " ".join(sentence(rng, *words) for _ in range(rng.randint(*sentences)))
+
+
+def scaled_counts(scale):
+    return {sheet: max(1, round(count * scale)) for sheet, count in BASE_COUNTS.items()}
+
+
+def generate(path, scale=10.0, seed=0):
+    """Write a synthetic workbook to ``path`` and return its per-sheet row counts."""
+    rng = random.Random(seed)
+    counts = scaled_counts(scale)
+    wb = openpyxl.Workbook(write_only=True)
+
+    n_caps = counts["Capabilities"]
+    caps = [(f"C{i}", f"Capability {i}", DOMAINS[(i - 1) % len(DOMAINS)])
+            for i in range(1, n_caps + 1)]
+    evidence_keys = [f"evidence_{i:04d}" for i in range(1, counts["EvidenceTypes_Ref"] + 1)]
+
+    # Observables are dealt round-robin so every capability gets a share
+    obs_by_cap = {cap_id: [] for cap_id, _, _ in caps}
+    observables = []
+    for i in range(counts["Observables"]):
+        cap_id = caps[i % n_caps][0]
+        obs_id = f"{cap_id}-O{len(obs_by_cap[cap_id]) + 1}"
+        obs_by_cap[cap_id].append(obs_id)
+        observables.append((obs_id, cap_id))
+    caps_with_obs = [cap_id for cap_id, obs in obs_by_cap.items() if obs]
+
+    ws = wb.create_sheet("Capabilities")
+    ws.append(["CapabilityID", "Name", "Domain", "Description", "PrimarySubTopics",
+               "ObservableCount", "V5Status"])
+    for cap_id, name, domain in caps:
+        ws.append([cap_id, name, domain, paragraph(rng),
+                   rng.randint(2, 16), len(obs_by_cap[cap_id]), "CARRIED"])
+
+    ws = wb.create_sheet("Observables")
+    ws.append(["ObservableID", "CapabilityID", "ShortText", "FullExample", "EvidenceTypes",
+               "DefaultWeight", "RequiredFrequency", "EMRelevance", "DirectorRelevance",
+               "LevelNotes", "Why", "How", "ExpectedResult", "Status"])
+    for obs_id, cap_id in observables:
+        ws.append([obs_id, cap_id, sentence(rng, 6, 12), paragraph(rng),
+                   ";".join(rng.sample(evidence_keys, min(2, len(evidence_keys)))),
+                   round(rng.uniform(0.02, 0.2), 3), rng.choice(FREQUENCIES),
+                   rng.choice(RELEVANCE), rng.choice(RELEVANCE), paragraph(rng, (1, 2)),
+                   paragraph(rng), paragraph(rng), paragraph(rng, (1, 2)), "CARRIED"])
+
+    ws = wb.create_sheet("AntiPatterns")
+    ws.append(["AntiPatternID", "ObservableIDs", "CapabilityID", "ShortDesc", "WarningSigns",
+               "Impact", "RecoveryActions", "SourceTopic", "MappingNotes"])
+    for i in range(1, counts["AntiPatterns"] + 1):
+        cap_id = rng.choice(caps_with_obs)
+        obs_ids = rng.sample(obs_by_cap[cap_id], min(rng.randint(1, 3), len(obs_by_cap[cap_id])))
+        ws.append([f"AP-{i:02d}", ";".join(obs_ids), cap_id,
+                   f"The {rng.choice(WORDS).title()} Trap {i} — {sentence(rng, 8, 14)}",
+                   paragraph(rng), paragraph(rng), paragraph(rng),
+                   sentence(rng, 3, 5), sentence(rng, 4, 8)])
+
+    ws = wb.create_sheet("CalibrationSignals")
+    ws.append(["SignalID", "ObservableID", "CapabilityID", "SignalText", "SignalType",
+               "SourceSubTopic"])
+    for i in range(1, counts["CalibrationSignals"] + 1):
+        obs_id, cap_id = rng.choice(observables)
+        ws.append([f"SIG-{i:03d}", obs_id, cap_id, paragraph(rng, (1, 2)),
+                   rng.choice(SIGNAL_TYPES), sentence(rng, 2, 4)])
+
+    ws = wb.create_sheet("Playbooks")
+    ws.append(["PlaybookID", "ObservableIDs", "CapabilityIDs", "Title", "Context",
+               "TopicsActivated", "DecisionFramework", "CommonMistakes",
+               "WhatGoodLooksLike", "MappingNotes"])
+    for i in range(1, counts["Playbooks"] + 1):
+        cap_ids = rng.sample(caps_with_obs, min(rng.randint(1, 2), len(caps_with_obs)))
+        obs_ids = [rng.choice(obs_by_cap[cap_id]) for cap_id in cap_ids]
+        ws.append([f"P-{cap_ids[0]}-{i}", ";".join(obs_ids), ";".join(cap_ids),
+                   sentence(rng, 5, 9), paragraph(rng), sentence(rng, 4, 8),
+                   paragraph(rng, (2, 4)), paragraph(rng), paragraph(rng),
+                   sentence(rng, 3, 6)])
+
+    ws = wb.create_sheet("RubricAnchors")
+    ws.append(["CapabilityID", "SourceTopic", "Level1_Developing", "Level3_Competent",
+               "Level5_Advanced", "Rationale"])
+    for i in range(counts["RubricAnchors"]):
+        ws.append([caps[i % n_caps][0], sentence(rng, 3, 5), paragraph(rng),
+                   paragraph(rng), paragraph(rng), sentence(rng, 4, 6)])
+
+    ws = wb.create_sheet("EvidenceTypes_Ref")
+    ws.append(["TypeKey", "DisplayName", "Description", "EvidenceStrength", "UsageCount"])
+    for key in evidence_keys:
+        ws.append([key, key.replace("_", " ").title(), sentence(rng, 6, 12),
+                   rng.choice(STRENGTHS), rng.randint(0, 20)])
+
+    ws = wb.create_sheet("Crosswalk")
+    ws.append(["OrigTopic", "OrigPrinciple", "OrigSubTopic", "PrimaryCapability",
+               "SecondaryCapability", "MappingNotes", "ObservableID"])
+    for _ in range(counts["Crosswalk"]):
+        obs_id, cap_id = rng.choice(observables)
+        ws.append([sentence(rng, 3, 5), sentence(rng, 2, 4), sentence(rng, 2, 4), cap_id,
+                   rng.choice(caps)[0], sentence(rng, 3, 6), obs_id])
+
+    ws = wb.create_sheet("Coverage_Plan")
+    ws.append(["CapabilityID", "Name", "Domain", "PrimarySubTopics", "Observables",
+               "Coverage%"])
+    for cap_id, name, domain in caps:
+        ws.append([cap_id, name, domain, rng.randint(2, 16), len(obs_by_cap[cap_id]),
+                   f"{rng.randint(50, 100)}%"])
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(path)
+    return {**counts, "Coverage_Plan": n_caps}
+
+
+def default_output(scale, seed=0):
+    return CACHE_DIR / f"matrix-x{scale:g}-seed{seed}.xlsx"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=10.0,
+                        help="multiple of the shipped workbook's row counts (default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="where to write the workbook "
+                             "(default: .cache/synthetic/matrix-x<scale>-seed<seed>.xlsx)")
+    args = parser.parse_args(argv)
+
+    path = args.output or default_output(args.scale, args.seed)
+    counts = generate(path, args.scale, args.seed)
+    print(f"Wrote {path}")
+    for sheet, count in counts.items():
+        print(f"  {sheet}: {count} rows")
+    print(f"  Total: {sum(counts.values())} rows")
+
+
+if __name__ == "__main__":
+    main()
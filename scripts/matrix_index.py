@@ -0,0 +1,66 @@
+"""Foreign-key indexes over extracted matrix records.
+
+Capabilities, observables, calibration signals, anti-patterns and playbooks
+reference each other by ID. MatrixIndex groups every child list by its parent
+ID in a single pass per relation, so nesting, search entries and coverage
+counts can all be served by dictionary lookups instead of rescanning lists.
+
+It works on the records extract-data.py produces and equally on the JSON in
+src/data:
+
+    from matrix_index import MatrixIndex
+
+    index = MatrixIndex(capabilities=caps, observables=obs, signals=sigs)
+    index.observables_by_capability["C3"]
+"""
+
+
+def group_by(records, key):
+    """Group records by ``record[key]`` in one pass, keeping record order.
+
+    A list-valued key (such as a playbook's ``capabilityIds``) files the
+    record under each of its values.
+    """
+    groups = {}
+    for record in records:
+        value = record.get(key)
+        for k in value if isinstance(value, list) else (value,):
+            groups.setdefault(k, []).append(record)
+    return groups
+
+
+class MatrixIndex:
+    """ID lookups and parent → children groupings for the matrix entities."""
+
+    def __init__(self, capabilities=(), observables=(), signals=(), anti_patterns=(),
+                 playbooks=()):
+        self.capabilities = {c["id"]: c for c in capabilities}
+        self.observables = {o["id"]: o for o in observables}
+        self.signals_by_observable = group_by(signals, "observableId")
+        self.signals_by_capability = group_by(signals, "capabilityId")
+        self.observables_by_capability = group_by(observables, "capabilityId")
+        self.anti_patterns_by_capability = group_by(anti_patterns, "capabilityId")
+        self.playbooks_by_capability = group_by(playbooks, "capabilityIds")
+
+    def capability(self, cap_id):
+        """Return the capability with this ID, or an empty dict."""
+        return self.capabilities.get(cap_id, {})
+
+    def capability_names(self, cap_ids):
+        return [self.capability(cid).get("name", "") for cid in cap_ids]
+
+    def capability_domains(self, cap_ids):
+        """Return the distinct domains of these capabilities, in first-seen order."""
+        return list(dict.fromkeys(self.capability(cid).get("domain", "") for cid in cap_ids))
+
+    def coverage_counts(self):
+        """Return per-capability counts of observables, signals, anti-patterns and playbooks."""
+        return {
+            cap_id: {
+                "observables": len(self.observables_by_capability.get(cap_id, ())),
+                "calibrationSignals": len(self.signals_by_capability.get(cap_id, ())),
+                "antiPatterns": len(self.anti_patterns_by_capability.get(cap_id, ())),
+                "playbooks": len(self.playbooks_by_capability.get(cap_id, ())),
+            }
+            for cap_id in self.capabilities
+        }
@@ -0,0 +1,146 @@
+"""SQLite export of the extracted matrix.
+
+One table per entity, with every scalar field as a snake_case column and
+list fields kept as JSON text. Every ID and foreign-key column is indexed.
+List-valued foreign keys (a playbook's observableIds, say) are also
+unpacked into link tables, so joins never have to parse JSON. Text fields
+get an external-content FTS5 table named ``<table>_fts``.
+
+    import sqlite3
+
+    db = sqlite3.connect("matrix.sqlite")
+    db.execute("SELECT id, short_text FROM observables WHERE capability_id = ?", ("C3",))
+    db.execute("SELECT rowid FROM observables_fts WHERE observables_fts MATCH 'incident'")
+"""
+
+import json
+import os
+import re
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from atomic_files import umask_mode
+
+# table → (ID column, foreign-key columns, full-text columns), by record key
+TABLES = {
+    "capabilities": ("id", [], ["name", "description"]),
+    "observables": ("id", ["capabilityId"],
+                    ["shortText", "fullExample", "levelNotes", "why", "how", "expectedResult"]),
+    "calibration_signals": ("id", ["observableId", "capabilityId"], ["signalText"]),
+    "anti_patterns": ("id", ["capabilityId"],
+                      ["name", "shortDesc", "warningSigns", "impact", "recoveryActions"]),
+    "playbooks": ("id", [],
+                  ["title", "context", "decisionFramework", "commonMistakes",
+                   "whatGoodLooksLike"]),
+    "rubric_anchors": (None, ["capabilityId"],
+                       ["sourceTopic", "level1Developing", "level3Competent",
+                        "level5Advanced", "rationale"]),
+    "evidence_types": ("typeKey", [], ["displayName", "description"]),
+    "crosswalk": (None, ["primaryCapability", "secondaryCapability", "observableId"],
+                  ["origTopic", "origPrinciple", "origSubTopic", "mappingNotes"]),
+    "coverage": ("capabilityId", [], []),
+}
+
+# table → record keys stored as columns. The schema always comes from here,
+# never from the records: it must not change when a sheet is empty, or when
+# the JSON builders have nested other records into these ones
+# (observables gain ``calibrationSignals``); keys not listed are not exported
+COLUMNS = {
+    "capabilities": ["id", "name", "slug", "domain", "description", "primarySubTopics",
+                     "observableCount", "v5Status"],
+    "observables": ["id", "capabilityId", "shortText", "slug", "fullExample", "evidenceTypes",
+                    "defaultWeight", "requiredFrequency", "emRelevance", "directorRelevance",
+                    "levelNotes", "why", "how", "expectedResult", "status"],
+    "calibration_signals": ["id", "observableId", "capabilityId", "signalText", "signalType",
+                            "sourceSubTopic"],
+    "anti_patterns": ["id", "name", "slug", "observableIds", "capabilityId", "shortDesc",
+                      "warningSigns", "impact", "recoveryActions", "sourceTopic",
+                      "mappingNotes"],
+    "playbooks": ["id", "slug", "observableIds", "capabilityIds", "title", "context",
+                  "topicsActivated", "decisionFramework", "commonMistakes",
+                  "whatGoodLooksLike", "mappingNotes"],
+    "rubric_anchors": ["capabilityId", "sourceTopic", "level1Developing", "level3Competent",
+                       "level5Advanced", "rationale"],
+    "evidence_types": ["typeKey", "slug", "displayName", "description", "evidenceStrength",
+                       "usageCount"],
+    "crosswalk": ["origTopic", "origPrinciple", "origSubTopic", "primaryCapability",
+                  "secondaryCapability", "mappingNotes", "observableId"],
+    "coverage": ["capabilityId", "name", "domain", "primarySubTopics", "observables",
+                 "coveragePercent"],
+}
+
+# link table → (parent table, parent ID key, list-valued record key, child column)
+LINKS = {
+    "observable_evidence_types": ("observables", "id", "evidenceTypes", "evidence_type_key"),
+    "anti_pattern_observables": ("anti_patterns", "id", "observableIds", "observable_id"),
+    "playbook_observables": ("playbooks", "id", "observableIds", "observable_id"),
+    "playbook_capabilities": ("playbooks", "id", "capabilityIds", "capability_id"),
+}
+
+
+def snake_case(key):
+    """Convert a record key such as ``level1Developing`` to ``level1_developing``."""
+    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", key).lower()
+
+
+def _sqlite_value(value):
+    return json.dumps(value, ensure_ascii=False) if isinstance(value, list) else value
+
+
+def _create_table(db, table, records):
+    id_key, fk_keys, text_keys = TABLES[table]
+    keys = COLUMNS[table]
+    columns = [snake_case(k) for k in keys]
+    db.execute(f"CREATE TABLE {table} ({', '.join(columns)})")
+    db.executemany(
+        f"INSERT INTO {table} VALUES ({', '.join('?' * len(keys))})",
+        ([_sqlite_value(r.get(k)) for k in keys] for r in records),
+    )
+    for key in ([id_key] if id_key else []) + fk_keys:
+        column = snake_case(key)
+        db.execute(f"CREATE INDEX idx_{table}_{column} ON {table} ({column})")
+    if text_keys:
+        text_columns = ", ".join(snake_case(k) for k in text_keys)
+        db.execute(f"CREATE VIRTUAL TABLE {table}_fts USING fts5("
+                   f"{text_columns}, content='{table}', content_rowid='rowid')")
+        db.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
+
+
+def _create_link_table(db, link, tables):
+    parent, id_key, list_key, child_column = LINKS[link]
+    parent_column = f"{parent.rstrip('s')}_id"
+    db.execute(f"CREATE TABLE {link} ({parent_column}, {child_column})")
+    db.executemany(
+        f"INSERT INTO {link} VALUES (?, ?)",
+        ((r[id_key], child) for r in tables.get(parent, ()) for child in r.get(list_key, ())),
+    )
+    db.execute(f"CREATE INDEX idx_{link}_{parent_column} ON {link} ({parent_column})")
+    db.execute(f"CREATE INDEX idx_{link}_{child_column} ON {link} ({child_column})")
+
+
+def export(path, tables):
+    """Write ``tables`` (table name → records) to a fresh SQLite database.
+
+    The database is built in a temp file and renamed over ``path``, so
+    readers never see a half-written export.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".sqlite.tmp")
+    os.close(fd)
+    try:
+        db = sqlite3.connect(tmp)
+        try:
+            with db:
+                for table in TABLES:
+                    _create_table(db, table, tables.get(table, []))
+                for link in LINKS:
+                    _create_link_table(db, link, tables)
+        finally:
+            db.close()
+        os.chmod(tmp, umask_mode())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
@@ -0,0 +1,421 @@
+"""Ranking rules and an incrementally maintained ranked priority queue.
+
+generate-priority-queue.py ranks scored articles by ``sort_key``. Rather
+than re-sorting everything whenever a few articles are rescored, added or
+removed, a RankedQueue keeps entries in key order in a bucketed sorted list:
+an insert or removal is a binary search plus a bounded list insert. The
+queue file is then kept as a full base file plus an append-only delta of
+upserts and removals (``<name>.delta.jsonl`` next to it), which readers
+replay. A full build ranks every article at once with a single NumPy
+lexsort over columns of the sort_key fields (see ranked_keys). Readers that
+only need the ranked entries use load_ranked, which keeps the base file's
+order and places just the delta's upserts:
+
+    from priority_queue import load_ranked
+
+    for entry in load_ranked("reference/articles-priority-queue.json"):
+        entry["rank"], entry["tier"]
+"""
+
+import gc
+import hashlib
+import marshal
+import os
+from bisect import bisect_left, insort
+from datetime import datetime
+from pathlib import Path
+
+from article_io import read_records
+from atomic_files import atomic_write
+
+try:
+    import numpy as np
+except ImportError:  # only needed for columnar ranking; sort_key is used instead
+    np = None
+
+STATE_DIR = Path(__file__).parent.parent / ".cache" / "priority-queue"
+# The state is plain JSON-derived data, so it is stored with marshal, which
+# dumps it several times faster than pickle
+STATE_FORMAT = ("ranked-queue", 1, marshal.version)
+
+# Capability coverage priority (lower coverage = higher priority)
+# From the plan's gap analysis
+CAPABILITY_PRIORITY = {
+    "C10": 1,  # 62% coverage
+    "C12": 1,  # 62% coverage
+    "C7":  2,  # 64% coverage
+    "C14": 2,  # 67% coverage
+    "C13": 3,  # 100% but new, low depth
+    "C2":  3,  # 100% but only 4 observables
+    "C8":  3,  # 100% but only 6 observables
+    "C11": 4,  # 80% coverage
+    "C4":  5,
+    "C9":  5,
+    "C1":  6,
+    "C3":  6,
+    "C5":  6,
+    "C6":  6,
+    "general": 7,
+}
+
+# Type priority: Report > Webinar > Talk/Video
+TYPE_PRIORITY = {"Report": 0, "Webinar": 1, "Guide": 1, "Deep Dive": 1,
+                 "Talk/Video": 2, "Huddle/Panel": 2}
+
+# Queue fields that aren't part of a scored article
+RANK_FIELDS = ('rank', 'tier')
+
+
+def parse_date(date_str):
+    """Parse date string, return sortable value (higher = more recent)."""
+    try:
+        return datetime.strptime(date_str[:10], '%Y-%m-%d').timestamp()
+    except (ValueError, TypeError):
+        return 0
+
+
+def tier_of(relevance):
+    if relevance >= 4:
+        return 1
+    elif relevance == 3:
+        return 2
+    return 3
+
+
+def sort_key(article):
+    """Sort key: lower = higher priority."""
+    # Tier (1 = highest priority)
+    relevance = article['relevance']
+    tier = tier_of(relevance)
+
+    # Capability priority (lower = higher priority)
+    cap = article['primaryCapability']
+    cap_priority = CAPABILITY_PRIORITY.get(cap, 7)
+
+    # Enrichment specificity: specific types > learning-resource only
+    etypes = article.get('enrichmentTypes', [])
+    specific_types = [e for e in etypes if e not in ('learning-resource',)]
+    enrichment_specificity = 0 if specific_types else 1
+
+    # Word count (higher = more substantive = higher priority)
+    word_count = -(article.get('wordCount', 0))
+
+    # Type priority: Report > Webinar > Talk/Video
+    article_type_priority = TYPE_PRIORITY.get(article.get('type', ''), 3)
+
+    # Recency (negative timestamp = more recent = higher priority)
+    recency = -parse_date(article.get('date', ''))
+
+    return (tier, cap_priority, enrichment_specificity, -relevance,
+            article_type_priority, word_count, recency)
+
+
+def queue_key(article):
+    """sort_key with the article ID as a final tie-break, so the order is total.
+
+    For input in ID order this ranks exactly like a stable sort on sort_key.
+    """
+    return (*sort_key(article), article['id'])
+
+
+def rank_columns(articles):
+    """Encode the sort_key fields of ``articles`` as NumPy columns, most significant first.
+
+    Each field is computed once per article with no per-article tuple, and
+    dates are parsed once per distinct date string rather than per article.
+    """
+    n = len(articles)
+    relevance = np.fromiter((a['relevance'] for a in articles), np.int64, n)
+    tier = np.where(relevance >= 4, 1, np.where(relevance == 3, 2, 3))
+    cap_priority = np.fromiter(
+        (CAPABILITY_PRIORITY.get(a['primaryCapability'], 7) for a in articles), np.int64, n)
+    enrichment_specificity = np.fromiter(
+        (0 if any(e != 'learning-resource' for e in a.get('enrichmentTypes', [])) else 1
+         for a in articles), np.int64, n)
+    type_priority = np.fromiter(
+        (TYPE_PRIORITY.get(a.get('type', ''), 3) for a in articles), np.int64, n)
+    word_count = np.fromiter((-a.get('wordCount', 0) for a in articles), np.int64, n)
+    dates = [a.get('date', '') for a in articles]
+    stamps = {d: -parse_date(d) for d in set(dates)}
+    recency = np.fromiter((stamps[d] for d in dates), np.float64, n)
+    return (tier, cap_priority, enrichment_specificity, -relevance, type_priority,
+            word_count, recency)
+
+
+def ranked_keys(articles):
+    """Return the queue_key of every article, sorted.
+
+    With NumPy, the columns from rank_columns are ranked by one lexsort
+    (IDs as the last tie-break) and the keys are assembled from the sorted
+    columns; without it, this is ``sorted(map(queue_key, articles))``.
+    """
+    if np is None or not articles:
+        return sorted(map(queue_key, articles))
+    columns = rank_columns(articles)
+    ids = [a['id'] for a in articles]
+    order = np.lexsort((np.asarray(ids), *reversed(columns)))
+    return list(zip(*(column[order].tolist() for column in columns),
+                    [ids[i] for i in order.tolist()]))
+
+
+class RankedQueue:
+    """Queue entries kept in queue_key order, addressable by article ID.
+
+    Keys live in a list of sorted buckets of at most 2 × LOAD keys, indexed
+    by each bucket's largest key, so locating a key is a binary search over
+    buckets and then within one; inserts and removals only shift a single
+    bounded bucket. Article IDs must be unique; a duplicate raises
+    ValueError rather than one of the entries silently winning.
+    """
+
+    LOAD = 512
+
+    def __init__(self, entries=()):
+        self.entries = {}
+        duplicates = []
+        for entry in entries:
+            if entry['id'] in self.entries:
+                duplicates.append(entry['id'])
+            self.entries[entry['id']] = entry
+        if duplicates:
+            raise ValueError(f"Duplicate article IDs: {_id_list(duplicates)}")
+        ordered = ranked_keys(list(self.entries.values()))
+        self.keys = {key[-1]: key for key in ordered}
+        self._buckets = [ordered[i:i + self.LOAD] for i in range(0, len(ordered), self.LOAD)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, article_id):
+        return article_id in self.entries
+
+    def __iter__(self):
+        """Yield entries in rank order."""
+        for bucket in self._buckets:
+            for key in bucket:
+                yield self.entries[key[-1]]
+
+    def _insert(self, key):
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+        i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        bucket = self._buckets[i]
+        insort(bucket, key)
+        self._maxes[i] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            self._buckets[i:i + 1] = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            self._maxes[i:i + 1] = [bucket[self.LOAD - 1], bucket[-1]]
+
+    def _delete(self, key):
+        i = bisect_left(self._maxes, key)
+        bucket = self._buckets[i]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self._maxes[i] = bucket[-1]
+        else:
+            del self._buckets[i]
+            del self._maxes[i]
+
+    def upsert(self, entry):
+        """Insert an entry, or replace the one with the same ID."""
+        article_id = entry['id']
+        if article_id in self.keys:
+            self._delete(self.keys[article_id])
+        key = queue_key(entry)
+        self.entries[article_id] = entry
+        self.keys[article_id] = key
+        self._insert(key)
+
+    def remove(self, article_id):
+        """Remove the entry with this ID; returns it, or None if absent."""
+        if article_id not in self.keys:
+            return None
+        self._delete(self.keys.pop(article_id))
+        return self.entries.pop(article_id)
+
+    def rank(self, article_id):
+        """Return the 1-based rank of an entry."""
+        key = self.keys[article_id]
+        i = bisect_left(self._maxes, key)
+        return (sum(len(b) for b in self._buckets[:i])
+                + bisect_left(self._buckets[i], key) + 1)
+
+    def apply(self, op):
+        """Apply one delta operation: ``{"op": "upsert", "article": {...}}`` or ``{"op": "remove", "id": ...}``."""
+        if op['op'] == 'upsert':
+            self.upsert(op['article'])
+        elif op['op'] == 'remove':
+            self.remove(op['id'])
+        else:
+            raise ValueError(f"Unknown queue delta op: {op['op']!r}")
+
+    def sync(self, scored):
+        """Bring the queue in line with a scored article list; return the delta ops applied.
+
+        Articles whose scored fields are unchanged are left alone. Changed
+        ones keep any queue-only annotations (such as review flags) that the
+        scored record doesn't carry; articles missing from ``scored`` are
+        removed.
+        """
+        ops, seen, duplicates = [], set(), []
+        for record in scored:
+            article_id = record['id']
+            if article_id in seen:
+                duplicates.append(article_id)
+                continue
+            seen.add(article_id)
+            old = self.entries.get(article_id)
+            if old is not None and record.items() <= old.items():
+                continue
+            if old is not None:
+                record = {**record, **{k: v for k, v in old.items()
+                                       if k not in record and k not in RANK_FIELDS}}
+            ops.append({'op': 'upsert', 'id': article_id, 'article': record})
+        if duplicates:
+            raise ValueError(f"Duplicate article IDs: {_id_list(duplicates)}")
+        ops += [{'op': 'remove', 'id': i} for i in self.entries if i not in seen]
+        for op in ops:
+            self.apply(op)
+        return ops
+
+    # ── Persistence ─────────────────────────────────────────────────
+    def save(self, path, files=()):
+        """Persist the queue, stamped with the current size and mtime of ``files``."""
+        save_marshal_state(path, STATE_FORMAT, files, (self.entries, self._buckets))
+
+    @classmethod
+    def load(cls, path, files=()):
+        """Load a saved queue, or return None if it's missing or ``files`` changed since."""
+        state = load_marshal_state(path, STATE_FORMAT, files)
+        if state is None:
+            return None
+        entries, buckets = state
+        queue = cls()
+        queue.entries = entries
+        queue._buckets = buckets
+        queue._maxes = [bucket[-1] for bucket in buckets]
+        queue.keys = {key[-1]: key for bucket in buckets for key in bucket}
+        return queue
+
+
+def _id_list(ids, limit=10):
+    ids = list(dict.fromkeys(ids))
+    more = f" and {len(ids) - limit} more" if len(ids) > limit else ""
+    return ", ".join(map(str, ids[:limit])) + more
+
+
+def file_stamp(files):
+    """Return the size and mtime of each of ``files``; a saved state is valid while they match."""
+    stamp = []
+    for path in files:
+        try:
+            st = os.stat(path)
+            stamp.append((str(path), st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            stamp.append((str(path), None, None))
+    return stamp
+
+
+def save_marshal_state(path, fmt, files, state):
+    """Marshal ``state`` to ``path`` behind a header of ``fmt`` and the file_stamp of ``files``."""
+    with atomic_write(path) as f:
+        marshal.dump((fmt, file_stamp(files)), f)
+        marshal.dump(state, f)
+
+
+def load_marshal_state(path, fmt, files):
+    """Return the state save_marshal_state wrote to ``path``.
+
+    Returns None if the file is missing or unreadable, was saved in another
+    format, or any of ``files`` changed since.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if marshal.load(f) != (fmt, file_stamp(files)):
+                return None
+            # marshal.load reads a file a few bytes at a time, so the body
+            # is read whole, and unmarshalled with the cyclic GC paused
+            body = f.read()
+        gc.disable()
+        try:
+            return marshal.loads(body)
+        finally:
+            gc.enable()
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def delta_path(path):
+    """Return the delta file that goes with a queue file."""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.delta.jsonl")
+
+
+def state_path(path):
+    """Return where the RankedQueue for a queue file is persisted.
+
+    The name carries a digest of the queue file's resolved path, so queues
+    with the same file name in different directories don't share a state.
+    """
+    path = Path(path).resolve()
+    digest = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:12]
+    return STATE_DIR / f"{path.name}-{digest}.state"
+
+
+def load_queue(path):
+    """Return the queue at ``path`` with its delta file (if any) replayed."""
+    queue = RankedQueue(read_records(path))
+    delta = delta_path(path)
+    if delta.exists():
+        for op in read_records(delta):
+            queue.apply(op)
+    return queue
+
+
+def load_ranked(path):
+    """Return the entries of the queue at ``path``, delta applied, in rank order.
+
+    The base file is written in rank order, so unlike load_queue this
+    doesn't re-rank it: base entries keep their file order, entries the
+    delta touches are dropped, and the delta's final upserts are placed by
+    binary search on queue_key, which only computes keys for the probed
+    entries. A base file whose ranks don't run 1, 2, 3, ... falls back to
+    load_queue. Entries get fresh ``rank`` and ``tier`` fields.
+    """
+    base = list(read_records(path))
+    if any(entry.get('rank') != rank for rank, entry in enumerate(base, 1)):
+        return list(ranked_entries(load_queue(path)))
+    delta = delta_path(path)
+    latest = {}
+    if delta.exists():
+        for op in read_records(delta):
+            if op['op'] == 'upsert':
+                latest[op['article']['id']] = op['article']
+            elif op['op'] == 'remove':
+                latest[op['id']] = None
+            else:
+                raise ValueError(f"Unknown queue delta op: {op['op']!r}")
+    if latest:
+        base = [entry for entry in base if entry['id'] not in latest]
+        upserts = sorted(((queue_key(article), article)
+                          for article in latest.values() if article is not None),
+                         key=lambda item: item[0])
+        merged, start = [], 0
+        for key, article in upserts:
+            pos = bisect_left(base, key, lo=start, key=queue_key)
+            merged += base[start:pos]
+            merged.append(article)
+            start = pos
+        base = merged + base[start:]
+    return list(ranked_entries(base))
+
+
+def ranked_entries(queue):
+    """Yield queue entries in order with fresh ``rank`` and ``tier`` fields."""
+    for rank, entry in enumerate(queue, 1):
+        entry['rank'] = rank
+        entry['tier'] = tier_of(entry['relevance'])
+        yield entry
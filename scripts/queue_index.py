@@ -0,0 +1,226 @@
+"""Capability, tier and enrichment-type postings over the ranked priority queue.
+
+Review tooling mostly asks for a small slice of the queue ("the best 20
+unreviewed C10 articles"). QueueIndex files every queue entry, once, under
+each capability it scores for, its tier and its enrichment types. Each
+posting list is kept in rank order, so a top-K query walks the shortest
+matching list and stops after K hits instead of sorting the whole queue:
+
+    from queue_index import load_index
+
+    index = load_index("reference/articles-priority-queue.json")
+    index.top(20, capability="C10")
+    index.top(10, tier=1, enrichment="playbook", by="score", capability="C7")
+
+load_index saves the built index with marshal next to the queue's
+RankedQueue state, stamped with the queue and delta files, so a query only
+reads and indexes the queue again after either changes. What is saved is
+the postings plus the few per-entry fields a query filters on (ID, reviewed
+flag, capability scores); the entries themselves go one JSON line each to a
+``.entries`` file beside it, and a loaded index reads back only the lines a
+query returns. load_shard_index does the same for a tier's shards.
+"""
+
+import heapq
+import json
+import marshal
+from bisect import bisect_left
+from pathlib import Path
+
+from atomic_files import atomic_write
+from priority_queue import (delta_path, load_marshal_state, load_ranked, save_marshal_state,
+                            state_path)
+from queue_shards import MANIFEST_NAME, read_manifest, read_shards, select_shards
+
+INDEX_FORMAT = ("queue-index", 2, marshal.version)
+
+
+class QueueIndex:
+    """Rank-ordered postings over priority-queue entries.
+
+    Entries are the records generate-priority-queue.py writes (with ``rank``
+    and ``tier``), in rank order, as load_ranked and read_shards return
+    them. An entry counts as reviewed when its ``reviewed`` flag is set;
+    reviewed entries are skipped unless asked for. Queries only look at
+    ``ids``, ``flagged`` ({id: reviewedInSession} of flagged entries) and
+    the postings, so ``entries`` is only read for the entries returned.
+    """
+
+    def __init__(self, queue):
+        self.entries = list(queue)
+        self.ids = [entry['id'] for entry in self.entries]
+        self.flagged = {entry['id']: entry.get('reviewedInSession')
+                        for entry in self.entries if entry.get('reviewed')}
+        self.postings = {}
+        self.scores = {}
+        for pos, entry in enumerate(self.entries):
+            for key in self._keys(entry):
+                self.postings.setdefault(key, []).append(pos)
+                if key[0] == 'capability':
+                    self.scores.setdefault(key[1], []).append(
+                        entry.get('capabilityScores', {}).get(key[1], 0))
+        self._positions = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def position(self, article_id):
+        """Return the position of an article ID in the index, or None."""
+        if self._positions is None:
+            self._positions = {article_id: pos for pos, article_id in enumerate(self.ids)}
+        return self._positions.get(article_id)
+
+    def _find(self, key, pos):
+        """Return where ``pos`` is in the posting list for ``key``, or None."""
+        positions = self.postings.get(key, ())
+        i = bisect_left(positions, pos)
+        return i if i < len(positions) and positions[i] == pos else None
+
+    def score(self, pos, capability):
+        """Return the entry at ``pos``'s score for ``capability`` (0 if it has none)."""
+        i = self._find(('capability', capability), pos)
+        return 0 if i is None else self.scores[capability][i]
+
+    @staticmethod
+    def _keys(entry):
+        caps = dict.fromkeys([entry.get('primaryCapability'), *entry.get('capabilityScores', {})])
+        yield from (('capability', cap) for cap in caps if cap)
+        yield ('tier', entry.get('tier'))
+        yield from (('enrichment', e) for e in entry.get('enrichmentTypes', ()))
+
+    def candidates(self, capability=None, tier=None, enrichment=None):
+        """Yield the positions of entries matching every given filter, in rank order.
+
+        Only the shortest matching posting list is walked; each position is
+        looked up in the other filters' lists by binary search.
+        """
+        filters = [key for key in (('capability', capability), ('tier', tier),
+                                   ('enrichment', enrichment)) if key[1] is not None]
+        if not filters:
+            yield from range(len(self))
+            return
+        shortest = min(filters, key=lambda key: len(self.postings.get(key, ())))
+        rest = [key for key in filters if key != shortest]
+        for pos in self.postings.get(shortest, ()):
+            if all(self._find(key, pos) is not None for key in rest):
+                yield pos
+
+    def top(self, k, capability=None, tier=None, enrichment=None, reviewed=False,
+            by="rank", exclude=()):
+        """Return the best ``k`` entries matching every given filter.
+
+        ``by="rank"`` keeps queue order, so the walk stops at the k-th match.
+        ``by="score"`` orders by the entry's score for ``capability`` (then
+        rank) with a k-bounded heap over the candidates. Entries whose ID is
+        in ``exclude`` (a set) are skipped.
+        """
+        ids = self.ids
+        positions = (pos for pos in self.candidates(capability, tier, enrichment)
+                     if (reviewed or ids[pos] not in self.flagged) and ids[pos] not in exclude)
+        if by == "rank":
+            return [self.entries[pos] for _, pos in zip(range(k), positions)]
+        if by != "score" or capability is None:
+            raise ValueError('by="score" needs a capability; otherwise use by="rank"')
+        best = heapq.nsmallest(k, positions, key=lambda pos: (-self.score(pos, capability), pos))
+        return [self.entries[pos] for pos in best]
+
+    # ── Persistence ─────────────────────────────────────────────────
+    def save(self, path, files=()):
+        """Persist the index, stamped with the current size and mtime of ``files``.
+
+        The entries are written to ``path`` with an ``.entries`` suffix,
+        which is stamped along with ``files``.
+        """
+        entries_path = Path(path).with_suffix('.entries')
+        offsets, offset = [], 0
+        with atomic_write(entries_path) as f:
+            for entry in self.entries:
+                line = json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n'
+                f.write(line)
+                offsets.append(offset)
+                offset += len(line)
+        save_marshal_state(path, INDEX_FORMAT, [*files, entries_path],
+                           (self.ids, self.flagged, self.postings, self.scores, offsets))
+
+    @classmethod
+    def load(cls, path, files=()):
+        """Load a saved index, or return None if it's missing or ``files`` changed since."""
+        entries_path = Path(path).with_suffix('.entries')
+        state = load_marshal_state(path, INDEX_FORMAT, [*files, entries_path])
+        if state is None:
+            return None
+        index = cls.__new__(cls)
+        index.ids, index.flagged, index.postings, index.scores, offsets = state
+        index.entries = EntryFile(entries_path, offsets)
+        index._positions = None
+        return index
+
+
+class EntryFile:
+    """The entries of a loaded QueueIndex, read from its ``.entries`` file as they're asked for.
+
+    Each entry is decoded once and then kept, so changes made to it stick
+    for as long as the index is in use.
+    """
+
+    def __init__(self, path, offsets):
+        self.path = Path(path)
+        self.offsets = offsets
+        self._decoded = {}
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, pos):
+        entry = self._decoded.get(pos)
+        if entry is None:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offsets[pos])
+                entry = self._decoded[pos] = json.loads(f.readline())
+        return entry
+
+    def __iter__(self):
+        """Yield every entry in rank order, reading the file once."""
+        with open(self.path, 'rb') as f:
+            for pos, line in enumerate(f):
+                entry = self._decoded.get(pos)
+                if entry is None:
+                    entry = self._decoded[pos] = json.loads(line)
+                yield entry
+
+
+def index_path(path):
+    """Return where the QueueIndex for a queue file is persisted (next to its RankedQueue state)."""
+    return state_path(path).with_suffix('.index')
+
+
+def load_index(path):
+    """Return a QueueIndex over the queue at ``path``, delta applied.
+
+    The saved index is used while the queue and delta files are unchanged;
+    otherwise the entries come from load_ranked (no re-ranking) and the new
+    index is saved for next time.
+    """
+    files = [path, delta_path(path)]
+    index = QueueIndex.load(index_path(path), files)
+    if index is None:
+        index = QueueIndex(load_ranked(path))
+        index.save(index_path(path), files)
+    return index
+
+
+def load_shard_index(directory, tier=None):
+    """Return a QueueIndex over the shards of ``tier`` (every shard if None).
+
+    Saved and reused like load_index, stamped with the manifest and the
+    shards read.
+    """
+    directory = Path(directory)
+    names = select_shards(read_manifest(directory), tier)
+    files = [directory / MANIFEST_NAME, *(directory / name for name in names)]
+    path = index_path(directory / (f"tier{tier}" if tier else "all"))
+    index = QueueIndex.load(path, files)
+    if index is None:
+        index = QueueIndex(read_shards(directory, tier=tier))
+        index.save(path, files)
+    return index
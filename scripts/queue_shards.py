@@ -0,0 +1,143 @@
+"""Tier × primary-capability shards of the ranked priority queue, with a manifest.
+
+Most consumers of the queue only want a slice of it ("Tier 1 for C10"), yet
+the queue file has to be read whole. generate-priority-queue.py --shards
+also splits the ranked queue into one JSON Lines shard per (tier,
+primaryCapability) pair, in rank order, next to a manifest.json that records
+each shard's tier, capability, entry count, rank range and SHA-256. A tier
+or a capability is then a handful of shards, merged back by rank, and a
+dashboard can re-read only the shards whose digest moved since it last
+looked:
+
+    from queue_shards import changed_shards, read_shards
+
+    for entry in read_shards("reference/priority-queue-shards", tier=1, capability="C10"):
+        entry["rank"], entry["title"]
+    stale = changed_shards("reference/priority-queue-shards", seen_digests)
+
+Shards whose bytes would not change are not rewritten, and shards for pairs
+that no longer occur are deleted. Shards only change when they are written
+again, so stale_source reports when the queue they were split from (or its
+delta file) has been modified since.
+"""
+
+import hashlib
+import heapq
+import json
+import re
+from pathlib import Path
+
+from priority_queue import delta_path
+
+MANIFEST_NAME = "manifest.json"
+SHARD_FORMAT = 1
+
+
+def shard_name(tier, capability):
+    """Return the file name of the shard for a tier and primary capability."""
+    return f"tier{tier}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', str(capability))}.jsonl"
+
+
+def _digest(path):
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def read_manifest(directory):
+    """Return the manifest of a shard directory (raises FileNotFoundError if it has none)."""
+    return json.loads((Path(directory) / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+
+def write_shards(directory, entries, source=None):
+    """Split ranked queue entries into shards under ``directory``.
+
+    ``entries`` are queue records with ``rank`` and ``tier``, in rank order.
+    ``source`` is the queue file they came from; the manifest records it as
+    an absolute path, so stale_source works from any directory. Returns the
+    new manifest and the names of the shards actually written.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    try:
+        previous = read_manifest(directory).get("shards", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        previous = {}
+
+    groups, total = {}, 0
+    for entry in entries:
+        groups.setdefault(shard_name(entry['tier'], entry['primaryCapability']), []).append(entry)
+        total += 1
+
+    shards, written = {}, []
+    for name, group in groups.items():
+        content = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in group).encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+        path = directory / name
+        if _digest(path) != digest:
+            path.write_bytes(content)
+            written.append(name)
+        shards[name] = {
+            "tier": group[0]['tier'],
+            "capability": group[0]['primaryCapability'],
+            "count": len(group),
+            "firstRank": group[0]['rank'],
+            "lastRank": group[-1]['rank'],
+            "sha256": digest,
+        }
+    for name in previous.keys() - shards.keys():
+        (directory / name).unlink(missing_ok=True)
+
+    source = str(Path(source).resolve()) if source else None
+    manifest = {"format": SHARD_FORMAT, "source": source, "total": total, "shards": shards}
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + "\n",
+                                           encoding="utf-8")
+    return manifest, written
+
+
+def stale_source(directory):
+    """Return the source queue file or delta that changed after the shards were written, or None.
+
+    A manifest without a source, or whose source no longer exists, is
+    never reported stale.
+    """
+    directory = Path(directory)
+    source = read_manifest(directory).get("source")
+    if not source or not Path(source).exists():
+        return None
+    written = (directory / MANIFEST_NAME).stat().st_mtime_ns
+    for path in (Path(source), delta_path(source)):
+        if path.exists() and path.stat().st_mtime_ns > written:
+            return path
+    return None
+
+
+def select_shards(manifest, tier=None, capability=None):
+    """Return the names of the shards holding a tier and/or primary capability."""
+    return [name for name, shard in manifest["shards"].items()
+            if (tier is None or shard["tier"] == tier)
+            and (capability is None or shard["capability"] == capability)]
+
+
+def _read_shard(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def read_shards(directory, tier=None, capability=None):
+    """Yield the queue entries of a tier and/or primary capability in rank order.
+
+    Only the matching shards are opened; they are merged lazily by rank.
+    """
+    directory = Path(directory)
+    names = select_shards(read_manifest(directory), tier, capability)
+    yield from heapq.merge(*(_read_shard(directory / name) for name in names),
+                           key=lambda entry: entry['rank'])
+
+
+def changed_shards(directory, seen):
+    """Return the shards whose digest differs from ``seen`` ({name: sha256}), new ones included."""
+    return [name for name, shard in read_manifest(directory)["shards"].items()
+            if seen.get(name) != shard["sha256"]]
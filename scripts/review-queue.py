@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Query the article priority queue for review work.
+
+  top               best K entries for a capability, tier and/or enrichment type,
+                    without re-sorting the queue (unreviewed only, unless
+                    --include-reviewed)
+  next-batch        the next N articles no review session has covered yet, in
+                    rank order, per reference/review-progress.json
+  complete-session  record a finished review session: its article IDs go into
+                    review-progress.json (replaced atomically) and the queue
+                    entries are flagged reviewed via the queue's delta file
+  plan              the unreviewed articles worth the most review time that fit
+                    a time budget (knapsack over readTime/wordCount minutes)
+
+Usage:
+    python3 scripts/review-queue.py top --capability C10 -k 20
+    python3 scripts/review-queue.py top --tier 1 --enrichment playbook --json
+    python3 scripts/review-queue.py top --capability C7 --by rank --include-reviewed
+    python3 scripts/review-queue.py --shards reference/priority-queue-shards top --tier 1
+    python3 scripts/review-queue.py next-batch -n 25 --capability C10 --json > batch.jsonl
+    python3 scripts/review-queue.py complete-session --batch batch.jsonl --focus "C10 gaps"
+    python3 scripts/review-queue.py plan --budget 2h30m --capability C7
+
+With --shards, entries come from the shard directory generate-priority-queue.py
+--shards writes, and a --tier query reads only that tier's shards. Shards older
+than the queue or its delta are refused; complete-session --shards updates the
+shards its flags touch, so they stay current.
+
+Queries use the QueueIndex saved by queue_index.load_index, so the queue is
+only read and indexed again after it changes. An article counts as reviewed
+when review-progress.json or its queue flags say so.
+"""
+
+import argparse
+import json
+
+from article_io import read_ids
+from queue_index import load_index, load_shard_index
+from queue_shards import stale_source, write_shards
+from review_plan import parse_budget, plan_batch, review_minutes
+from review_state import PROGRESS_PATH, ReviewState
+
+QUEUE_PATH = 'reference/articles-priority-queue.json'
+
+
+def print_entries(entries, as_json=False):
+    if as_json:
+        for a in entries:
+            print(json.dumps(a, ensure_ascii=False))
+        return
+    for a in entries:
+        cap = a['primaryCapability']
+        print(f"  #{a['rank']:4d} T{a['tier']} [R{a['relevance']}] {cap:7s} | "
+              f"{a['title'][:60]:<60s} | {a['type']}")
+    print(f"{len(entries)} entries")
+
+
+def queue_index(args, tier=None):
+    """A QueueIndex over the ranked queue, or over the shards of ``tier`` with --shards.
+
+    The index is saved under .cache and reused until its files change.
+    """
+    if args.shards:
+        stale = stale_source(args.shards)
+        if stale:
+            raise SystemExit(f"ERROR: {stale} changed after the shards in {args.shards} were "
+                             "written; re-run generate-priority-queue.py --shards")
+        return load_shard_index(args.shards, tier=tier)
+    return load_index(args.queue)
+
+
+def cmd_top(args):
+    index = queue_index(args, tier=args.tier)
+    state = ReviewState.load(args.progress, index)
+    entries = index.top(args.k, capability=args.capability, tier=args.tier,
+                        enrichment=args.enrichment, reviewed=True,
+                        exclude=() if args.include_reviewed else state.reviewed, by=args.by)
+    print_entries(entries, args.json)
+
+
+def cmd_next_batch(args):
+    index = queue_index(args, tier=args.tier)
+    state = ReviewState.load(args.progress, index)
+    print_entries(state.next_batch(index, args.n, capability=args.capability, tier=args.tier),
+                  args.json)
+
+
+def cmd_complete_session(args):
+    ids = list(args.ids)
+    if args.batch:
+        ids += sorted(read_ids(args.batch))
+    if not ids:
+        raise SystemExit("ERROR: no article IDs given (pass IDs or --batch)")
+    index = load_index(args.queue)
+    state = ReviewState.load(args.progress, index)
+    try:
+        record = state.complete_session(ids, session=args.session, date=args.date,
+                                        focus=args.focus)
+    except ValueError as e:
+        raise SystemExit(f"ERROR: {e}")
+    state.save()
+    flagged = state.flag_queue(args.queue, ids)
+    print(f"Session {record['session']}: {record['articlesReviewed']} articles newly reviewed "
+          f"({flagged} queue entries flagged)")
+    if args.shards:
+        _, written = write_shards(args.shards, index.entries, source=args.queue)
+        print(f"  Shards: {len(written)} rewritten in {args.shards}")
+    print(f"  Reviewed: {state.progress['totalReviewed']} of {state.progress['totalArticles']}")
+    for tier in (1, 2, 3):
+        print(f"  Remaining Tier {tier}: {state.progress[f'remainingTier{tier}']}")
+
+
+def cmd_plan(args):
+    index = queue_index(args, tier=args.tier)
+    state = ReviewState.load(args.progress, index)
+    unreviewed = state.next_batch(index, len(index), capability=args.capability,
+                                  tier=args.tier)
+    plan = plan_batch(unreviewed, args.budget, method="greedy" if args.greedy else "dp")
+    if args.json:
+        print_entries(plan.entries, as_json=True)
+        return
+    for a in plan.entries:
+        cap = a['primaryCapability']
+        print(f"  #{a['rank']:4d} T{a['tier']} [R{a['relevance']}] {cap:7s} | "
+              f"{a['title'][:60]:<60s} | {review_minutes(a):3d} min")
+    print(f"{len(plan.entries)} articles: {plan.minutes} of {args.budget} min, "
+          f"value {plan.value:g} (upper bound {plan.upper_bound:.1f}, {plan.method})")
+
+
+def budget_minutes(text):
+    try:
+        return parse_budget(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queue", default=QUEUE_PATH,
+                        help="priority queue, JSON Lines or a JSON array; its delta file is "
+                             f"replayed (default: {QUEUE_PATH})")
+    parser.add_argument("--shards", metavar="DIR",
+                        help="read the queue from this shard directory instead of --queue "
+                             "(complete-session updates it)")
+    parser.add_argument("--progress", default=PROGRESS_PATH,
+                        help=f"review progress (default: {PROGRESS_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    top = commands.add_parser("top", help="best K matching queue entries")
+    top.add_argument("-k", type=int, default=20, help="how many entries (default: 20)")
+    top.add_argument("--capability", help="capability ID, e.g. C10 (matches any capability "
+                                          "the article scored for)")
+    top.add_argument("--tier", type=int, choices=(1, 2, 3))
+    top.add_argument("--enrichment", help="enrichment type, e.g. playbook")
+    top.add_argument("--by", choices=("rank", "score"),
+                     help="queue rank, or the article's score for --capability (default: "
+                          "score with --capability, else rank)")
+    top.add_argument("--include-reviewed", action="store_true",
+                     help="also return entries already reviewed")
+    top.add_argument("--json", action="store_true", help="print entries as JSON Lines")
+    top.set_defaults(func=cmd_top)
+
+    batch = commands.add_parser("next-batch", help="next N unreviewed queue entries")
+    batch.add_argument("-n", type=int, default=25, help="how many entries (default: 25)")
+    batch.add_argument("--capability", help="capability ID, e.g. C10")
+    batch.add_argument("--tier", type=int, choices=(1, 2, 3))
+    batch.add_argument("--json", action="store_true", help="print entries as JSON Lines")
+    batch.set_defaults(func=cmd_next_batch)
+
+    complete = commands.add_parser("complete-session", help="record a finished review session")
+    complete.add_argument("ids", nargs="*", type=int, help="reviewed article IDs")
+    complete.add_argument("--batch", help="also mark the articles in this JSON Lines file "
+                                          "(e.g. saved next-batch --json output)")
+    complete.add_argument("--session", type=int,
+                          help="session number (default: one past the last)")
+    complete.add_argument("--date", help="session date, YYYY-MM-DD (default: today)")
+    complete.add_argument("--focus", help="what the session covered")
+    complete.set_defaults(func=cmd_complete_session)
+
+    plan = commands.add_parser("plan", help="best unreviewed articles for a time budget")
+    plan.add_argument("--budget", type=budget_minutes, required=True,
+                      help="review time, e.g. 90, 90m, 4h or 2h30m")
+    plan.add_argument("--capability", help="capability ID, e.g. C10")
+    plan.add_argument("--tier", type=int, choices=(1, 2, 3))
+    plan.add_argument("--greedy", action="store_true",
+                      help="value-density greedy instead of the exact DP")
+    plan.add_argument("--json", action="store_true", help="print entries as JSON Lines")
+    plan.set_defaults(func=cmd_plan)
+
+    args = parser.parse_args(argv)
+    if args.command == "top":
+        if args.by == "score" and not args.capability:
+            parser.error("--by score needs --capability")
+        args.by = args.by or ("score" if args.capability else "rank")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Reviewed-article index over reference/review-progress.json.
+
+review-progress.json records review sessions and what they added, but not
+which articles they covered; that lived only in the ``reviewed`` /
+``reviewedInSession`` flags of the priority queue, so finding the next
+unreviewed articles meant scanning (and, for the enrich-session scripts,
+rewriting) the whole queue. ReviewState keeps the reviewed IDs as a set,
+seeded from those legacy flags plus the ``articleIds`` each completed
+session now records, so picking the next batch is a rank-ordered walk of a
+QueueIndex that skips IDs in the set:
+
+    from review_state import ReviewState
+
+    index = QueueIndex(entries)
+    state = ReviewState.load("reference/review-progress.json", index)
+    batch = state.next_batch(index, 25, capability="C10")
+    state.complete_session([a["id"] for a in batch], focus="C10 follow-ups")
+    state.save()
+
+save() replaces review-progress.json atomically, so a crash mid-write never
+leaves a half-recorded session.
+"""
+
+import json
+from datetime import date as Date
+from pathlib import Path
+
+from article_io import write_json, write_records
+from priority_queue import delta_path
+from queue_index import QueueIndex
+
+PROGRESS_PATH = 'reference/review-progress.json'
+
+
+class ReviewState:
+    """Reviewed article IDs plus the review-progress document they're saved in.
+
+    ``index`` is a QueueIndex over the ranked queue; its legacy
+    ``reviewed`` flags seed the set, and the progress totals are counted
+    over its entries.
+    """
+
+    def __init__(self, progress, index=None, path=PROGRESS_PATH):
+        self.progress = progress
+        self.path = Path(path)
+        self.index = index if index is not None else QueueIndex(())
+        self.reviewed = dict(self.index.flagged)
+        for session in progress.get('sessions', []):
+            for article_id in session.get('articleIds', ()):
+                self.reviewed[article_id] = str(session['session'])
+
+    @classmethod
+    def load(cls, path=PROGRESS_PATH, index=None):
+        try:
+            progress = json.loads(Path(path).read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            progress = {"sessions": []}
+        return cls(progress, index, path)
+
+    def __contains__(self, article_id):
+        return article_id in self.reviewed
+
+    def __len__(self):
+        return len(self.reviewed)
+
+    def next_batch(self, index, n, capability=None, tier=None):
+        """Return the next ``n`` unreviewed entries of a QueueIndex, in rank order."""
+        return index.top(n, capability=capability, tier=tier, reviewed=True,
+                         exclude=self.reviewed)
+
+    def complete_session(self, article_ids, session=None, date=None, focus=None):
+        """Record a finished review session and return its session record.
+
+        IDs already reviewed are ignored. The session number defaults to one
+        past the highest so far. Totals and remaining-per-tier counts are
+        recomputed over the queue; call save() to persist.
+        """
+        unknown = [i for i in article_ids if self.index.position(i) is None]
+        if unknown:
+            raise ValueError(f"Not in the priority queue: {', '.join(map(str, unknown))}")
+        sessions = self.progress.setdefault('sessions', [])
+        if session is None:
+            session = max((s['session'] for s in sessions if isinstance(s.get('session'), int)),
+                          default=0) + 1
+        date = date or Date.today().isoformat()
+        new_ids = list(dict.fromkeys(i for i in article_ids if i not in self.reviewed))
+        for article_id in new_ids:
+            self.reviewed[article_id] = str(session)
+
+        record = {"session": session, "date": date}
+        if focus:
+            record["focus"] = focus
+        record["articlesReviewed"] = len(new_ids)
+        record["articleIds"] = new_ids
+        sessions.append(record)
+
+        ids = self.index.ids
+        remaining = {tier: sum(ids[pos] not in self.reviewed
+                               for pos in self.index.candidates(tier=tier))
+                     for tier in (1, 2, 3)}
+        self.progress.setdefault('metadata', {})['lastUpdated'] = date
+        for tier, count in remaining.items():
+            self.progress[f'remainingTier{tier}'] = count
+        self.progress['totalArticles'] = len(self.index)
+        self.progress['totalReviewed'] = len(self.index) - sum(remaining.values())
+        self.progress['reviewComplete'] = not any(remaining.values())
+        return record
+
+    def save(self, path=None):
+        """Atomically replace the progress file."""
+        write_json(path or self.path, self.progress)
+
+    def flag_queue(self, queue_path, article_ids):
+        """Set ``reviewed``/``reviewedInSession`` on queue entries via the queue's delta file.
+
+        Returns how many entries were flagged. The queue file itself isn't
+        rewritten; generate-priority-queue.py folds the delta in when it
+        compacts.
+        """
+        ops = []
+        for article_id in dict.fromkeys(article_ids):
+            entry = self.index.entries[self.index.position(article_id)]
+            session = self.reviewed.get(article_id)
+            if entry.get('reviewed') and entry.get('reviewedInSession') == session:
+                continue
+            entry.update(reviewed=True, reviewedInSession=session)
+            ops.append({'op': 'upsert', 'id': article_id, 'article': entry})
+        if ops:
+            write_records(delta_path(queue_path), ops, append=True)
+        return len(ops)
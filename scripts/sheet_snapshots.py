@@ -0,0 +1,172 @@
+"""Binary snapshots of raw workbook sheets, keyed by sheet name and sheet digest.
+
+Parsing XLSX with openpyxl (unzip + XML) dominates extraction time, so the
+raw row tuples of each sheet are persisted as a stream of pickled chunks the
+first time the sheet is read. A sheet's digest is taken from its own XML part
+in the XLSX zip (plus the workbook-wide shared strings and styles), without
+parsing any cells, so editing one sheet only invalidates that sheet's
+snapshot; the others keep loading from their snapshots instead of touching
+openpyxl. Snapshots of any other version of a sheet are evicted as soon as
+the workbook is opened.
+
+Other tools can read raw sheets the same way:
+
+    from sheet_snapshots import SnapshotWorkbook
+
+    with SnapshotWorkbook("reference/em_director_matrix_v6.xlsx") as wb:
+        for row in wb.iter_rows("Capabilities"):
+            ...
+"""
+
+import hashlib
+import os
+import pickle
+import posixpath
+import re
+import tempfile
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree
+
+import openpyxl
+
+SNAPSHOT_DIR = Path(__file__).parent.parent / ".cache" / "sheet-snapshots"
+SNAPSHOT_FORMAT = ("sheet-snapshot", 1)
+CHUNK_ROWS = 1024
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_DOC_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+# Parts every sheet's cell values depend on: shared strings hold the text of
+# string cells, and number formats in styles decide which numbers are dates
+SHARED_PARTS = ("xl/sharedStrings.xml", "xl/styles.xml")
+
+
+def workbook_digest(path):
+    """Return the SHA-256 digest of a workbook file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sheet_digests(path):
+    """Return {sheet name: SHA-256} of each sheet's XML part plus the shared parts.
+
+    Parts are read straight from the XLSX zip, so no cell is parsed; a
+    sheet's digest only moves when its own part, the shared strings or the
+    styles change.
+    """
+    with zipfile.ZipFile(path) as z:
+        parts = set(z.namelist())
+        rels = ElementTree.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{_PKG_REL_NS}Relationship")}
+        shared = hashlib.sha256()
+        for part in SHARED_PARTS:
+            if part in parts:
+                shared.update(part.encode("utf-8"))
+                shared.update(z.read(part))
+        digests = {}
+        workbook = ElementTree.fromstring(z.read("xl/workbook.xml"))
+        for sheet in workbook.iter(f"{_MAIN_NS}sheet"):
+            target = targets[sheet.get(f"{_DOC_REL_NS}id")]
+            part = (target[1:] if target.startswith("/")
+                    else posixpath.normpath(posixpath.join("xl", target)))
+            digest = shared.copy()
+            with z.open(part) as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            digests[sheet.get("name")] = digest.hexdigest()
+    return digests
+
+
+def _safe_name(text):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text)
+
+
+class SnapshotWorkbook:
+    """Read-only view of a workbook that serves sheets from raw snapshots.
+
+    ``iter_rows(sheet_name)`` yields the same value tuples as openpyxl's
+    ``ws.iter_rows(values_only=True)`` on a read-only, data-only workbook.
+    The workbook itself is only opened when a sheet has no snapshot yet.
+    """
+
+    def __init__(self, path, digests=None, snapshot_dir=SNAPSHOT_DIR):
+        self.path = Path(path)
+        self.digests = digests or sheet_digests(self.path)
+        path_key = hashlib.sha256(str(self.path.resolve()).encode("utf-8")).hexdigest()[:8]
+        self.snapshot_dir = Path(snapshot_dir) / f"{_safe_name(self.path.stem)}-{path_key}"
+        self._wb = None
+        self.evict_stale()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+
+    def snapshot_path(self, sheet_name):
+        digest = self.digests[sheet_name]
+        return self.snapshot_dir / f"{_safe_name(sheet_name)}-{digest[:16]}.pickle"
+
+    def evict_stale(self):
+        """Delete snapshots taken from any other version of this workbook's sheets."""
+        if not self.snapshot_dir.is_dir():
+            return
+        current = {self.snapshot_path(name).name for name in self.digests}
+        for path in self.snapshot_dir.glob("*.pickle"):
+            if path.name not in current:
+                path.unlink(missing_ok=True)
+
+    def iter_rows(self, sheet_name):
+        """Yield a sheet's raw row tuples, from its snapshot when one exists."""
+        path = self.snapshot_path(sheet_name)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return self._read_and_snapshot(sheet_name, path)
+        return self._read_snapshot(f)
+
+    def _read_snapshot(self, f):
+        with f:
+            if pickle.load(f) != SNAPSHOT_FORMAT:
+                raise ValueError(f"Unrecognised snapshot format in {f.name}")
+            while True:
+                try:
+                    chunk = pickle.load(f)
+                except EOFError:
+                    return
+                yield from chunk
+
+    def _read_and_snapshot(self, sheet_name, path):
+        # Rows are written to a temp file as they stream past and only
+        # renamed into place once the sheet has been read to the end, so a
+        # partially consumed or failed read never leaves a snapshot behind.
+        if self._wb is None:
+            self._wb = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+        rows = self._wb[sheet_name].iter_rows(values_only=True)
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.snapshot_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(SNAPSHOT_FORMAT, f, pickle.HIGHEST_PROTOCOL)
+                chunk = []
+                for row in rows:
+                    chunk.append(row)
+                    yield row
+                    if len(chunk) == CHUNK_ROWS:
+                        pickle.dump(chunk, f, pickle.HIGHEST_PROTOCOL)
+                        chunk = []
+                if chunk:
+                    pickle.dump(chunk, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)